@@ -8,14 +8,16 @@ Strategies implemented:
 4. Per-user caching - Cache user-specific data separately
 
 Cache keys format:
-- dashboard:stats:{user_id}:{role} - Dashboard stats per user/role
+- dashboard:stats:v{version}:user:{user_id} - Dashboard stats per user
 - analytics:{date_from}:{date_to} - Analytics for date range (shared)
 - tickets:list:{hash} - Ticket list with filters
+- users:approved:v{version} - Assignable users list, versioned on change
 """
 
 import hashlib
 import json
 import logging
+import time
 from functools import wraps
 from django.core.cache import cache
 from django.conf import settings
@@ -27,6 +29,10 @@ CACHE_TTL_DASHBOARD = 300  # 5 minutes - stats refresh frequently
 CACHE_TTL_ANALYTICS = 900  # 15 minutes - analytics are expensive
 CACHE_TTL_LISTS = 60       # 1 minute - lists change often
 CACHE_TTL_STATIC = 3600    # 1 hour - departments, products
+CACHE_TTL_USERS = 300      # 5 minutes - assignable users, versioned on change
+
+APPROVED_USERS_VERSION_KEY = 'users:approved:version'
+DASHBOARD_VERSION_KEY = 'dashboard:version'
 
 
 def get_cache_key(*args):
@@ -88,31 +94,9 @@ def cache_response(key_prefix, timeout=300, vary_on_user=False, vary_on_role=Fal
     return decorator
 
 
-def invalidate_dashboard_cache(user_id=None):
-    """
-    Invalidate dashboard cache.
-    If user_id provided, only invalidate that user's cache.
-    Otherwise, invalidate all dashboard caches.
-    """
-    if user_id:
-        # Invalidate specific user's dashboard
-        for role in ['manager', 'member']:
-            cache.delete(get_cache_key('dashboard', 'stats', f'user:{user_id}'))
-            cache.delete(get_cache_key('dashboard', 'stats', f'role:{role}'))
-    else:
-        # Use cache key pattern deletion if available (Redis)
-        try:
-            from django_redis import get_redis_connection
-            redis_conn = get_redis_connection("default")
-            keys = redis_conn.keys('*dashboard*')
-            if keys:
-                redis_conn.delete(*keys)
-                logger.info(f'Invalidated {len(keys)} dashboard cache keys')
-        except (ImportError, Exception) as e:
-            # Fallback for non-Redis cache
-            logger.debug(f'Pattern deletion not available: {e}')
-            cache.delete(get_cache_key('dashboard', 'stats', 'role:manager'))
-            cache.delete(get_cache_key('dashboard', 'stats', 'role:member'))
+def invalidate_dashboard_cache():
+    """Invalidate every user's dashboard stats; DashboardView keys embed the version."""
+    bump_version(DASHBOARD_VERSION_KEY)
 
 
 def invalidate_analytics_cache():
@@ -143,49 +127,40 @@ def invalidate_ticket_caches():
         pass
 
 
-def warm_dashboard_cache(user):
+def get_version(key):
     """
-    Pre-warm dashboard cache for a user.
-    Called after login or major ticket changes.
+    Read a cache version stamp. Versioned keys embed it, so bumping the
+    stamp invalidates every entry at once on any cache backend.
     """
-    from django.utils import timezone
-    from datetime import timedelta
-    from .models import Ticket
-    from django.db.models import Q
-
-    role = 'manager' if user.is_manager else 'member'
-    cache_key = get_cache_key('dashboard', 'stats', f'role:{role}')
-
-    # Check if already cached
-    if cache.get(cache_key):
-        return
-
-    # Build stats (same logic as DashboardView)
-    if user.is_manager:
-        tickets = Ticket.objects.filter(is_deleted=False)
-    else:
-        tickets = Ticket.objects.filter(
-            Q(requester=user) | Q(assigned_to=user),
-            is_deleted=False
-        )
+    version = cache.get(key)
+    if version is None:
+        # Start from the clock so an evicted counter never reuses old versions
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    """Move a version stamp on; entries keyed on the old one go stale."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        # No version yet; the next read starts a fresh one
+        pass
+
+
+def get_approved_users_version():
+    """
+    Version stamp of the assignable users list (UserListView).
+    Used in its cache key and as its ETag.
+    """
+    return get_version(APPROVED_USERS_VERSION_KEY)
+
 
-    now = timezone.now()
-
-    stats = {
-        'total_tickets': tickets.count(),
-        'pending_approval': tickets.filter(status=Ticket.Status.REQUESTED).count(),
-        'pending_creative': tickets.filter(status=Ticket.Status.PENDING_CREATIVE).count(),
-        'in_progress': tickets.filter(status=Ticket.Status.IN_PROGRESS).count(),
-        'completed': tickets.filter(status=Ticket.Status.COMPLETED).count(),
-        'approved': tickets.filter(status=Ticket.Status.APPROVED).count(),
-        'rejected': tickets.filter(status=Ticket.Status.REJECTED).count(),
-        'overdue': tickets.filter(deadline__lt=now).exclude(
-            status__in=[Ticket.Status.COMPLETED, Ticket.Status.REJECTED]
-        ).count(),
-    }
-
-    cache.set(cache_key, stats, CACHE_TTL_DASHBOARD)
-    logger.info(f'Warmed dashboard cache for role:{role}')
+def get_dashboard_cache_key(user):
+    """Per-user dashboard stats key; members only count their own tickets."""
+    version = get_version(DASHBOARD_VERSION_KEY)
+    return get_cache_key('dashboard', 'stats', f'v{version}', f'user:{user.id}')
 
 
 class CachedQuerySet:
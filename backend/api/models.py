@@ -90,6 +90,13 @@ class User(AbstractUser):
     failed_login_attempts = models.IntegerField(default=0)
     last_failed_login = models.DateTimeField(null=True, blank=True)
 
+    class Meta(AbstractUser.Meta):
+        # User management filters on approval/role and lists newest first
+        indexes = [
+            models.Index(fields=['is_approved', '-date_joined'], name='user_approved_joined_idx'),
+            models.Index(fields=['role', '-date_joined'], name='user_role_joined_idx'),
+        ]
+
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
 
@@ -368,13 +375,16 @@ class TicketProductItem(models.Model):
     class Meta:
         ordering = ['created_at']
 
-    def save(self, *args, **kwargs):
-        # Auto-set criteria for Ads products based on product name
+    def set_default_criteria(self):
+        """Auto-set criteria for Ads products based on product name"""
         if self.product and not self.criteria:
             if 'VID' in self.product.name.upper():
                 self.criteria = 'video'
             elif 'STATIC' in self.product.name.upper():
                 self.criteria = 'image'
+
+    def save(self, *args, **kwargs):
+        self.set_default_criteria()
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -21,7 +21,7 @@ class IsTicketOwnerOrManager(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.user.is_manager:
             return True
-        return obj.requester == request.user
+        return obj.requester_id == request.user.id
 
 
 class IsTicketParticipant(permissions.BasePermission):
@@ -30,9 +30,8 @@ class IsTicketParticipant(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.user.is_manager:
             return True
-        return (obj.requester == request.user or
-                obj.assigned_to == request.user or
-                obj.approver == request.user)
+        # Compare FK ids so the related users aren't loaded
+        return request.user.id in (obj.requester_id, obj.assigned_to_id, obj.approver_id)
 
 
 class CanApproveTicket(permissions.BasePermission):
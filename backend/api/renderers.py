@@ -0,0 +1,43 @@
+"""
+JSON renderers for the API.
+
+ORJSONRenderer encodes responses with orjson, which is considerably faster
+than the stdlib json module on large ticket/user lists. Output matches DRF's
+JSONRenderer: datetimes, Decimals, lazy strings and other non-native types
+are handed back to DRF's JSONEncoder so their formatting stays identical.
+
+Falls back to the stock JSONRenderer when orjson is not installed.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+_encoder_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Compact JSON renderer backed by orjson"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not HAS_ORJSON:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        # Indented output (e.g. ?indent=4 in the media type) keeps the stdlib path
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(
+            data,
+            default=_encoder_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
@@ -1,18 +1,162 @@
+import operator
+from datetime import timedelta
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
-from .models import Ticket, TicketComment, TicketAttachment, TicketCollaborator, Notification, Department, Product, TicketProductItem
+from django.db import models
+from django.db.models import (
+    Q, F, Count, Case, When, Value, BooleanField, CharField, Prefetch, OuterRef, Subquery
+)
+from django.db.models.functions import Coalesce, Now
+from django.utils import timezone
+from .models import Ticket, TicketComment, TicketAttachment, TicketCollaborator, Notification, Department, Product, TicketProductItem, ActivityLog
 
 User = get_user_model()
 
 
+def requested_fields(request):
+    """Return the set of field names from a ``?fields=a,b`` query param, or None"""
+    if request is None:
+        return None
+    fields = request.query_params.get('fields')
+    if not fields:
+        return None
+    return {name.strip() for name in fields.split(',') if name.strip()}
+
+
+def included_fields(request):
+    """Return the set of names from an ``?include=a,b`` query param (empty without one)"""
+    if request is None:
+        return set()
+    include = request.query_params.get('include', '')
+    return {name.strip() for name in include.split(',') if name.strip()}
+
+
+class DynamicFieldsMixin:
+    """
+    Serializer mixin that drops fields not listed in ``?fields=`` (or an
+    explicit ``fields`` kwarg). Without either, all fields are returned.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+
+        if fields is None:
+            fields = requested_fields(self.context.get('request'))
+        if fields is not None:
+            for field_name in self._get_fields_set().difference(fields):
+                self.fields.pop(field_name, None)
+
+    @classmethod
+    def _get_fields_set(cls):
+        # frozenset mirror of Meta.fields, built once per serializer class
+        if '_fields_set' not in cls.__dict__:
+            cls._fields_set = frozenset(cls.Meta.fields)
+        return cls._fields_set
+
+
+class EagerLoadingMixin:
+    """
+    Serializer mixin declaring the joins, prefetches and annotations its
+    fields read. Views run their queryset through ``setup_eager_loading()``
+    so this list lives next to the fields instead of in every view.
+
+    When ``fields`` (from ``?fields=``) is given, only the lookups for those
+    fields are applied: paths match on their first segment, annotations on
+    their name with any ``_annotated`` suffix removed.
+
+    ``only_fields`` lists the columns the serializer reads; views apply it
+    with ``.only()`` on read requests, where nothing else touches the rows.
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    annotations = {}
+    only_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None):
+        select_related = cls._wanted(cls.select_related_fields, fields)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        prefetch_related = cls._wanted(cls.prefetch_related_fields, fields)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        annotations = {
+            name: expression for name, expression in cls.annotations.items()
+            if fields is None or name.removesuffix('_annotated') in fields
+        }
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+        return queryset
+
+    @staticmethod
+    def _wanted(lookups, fields):
+        if fields is None:
+            return lookups
+        return [lookup for lookup in lookups if lookup.split('__', 1)[0] in fields]
+
+
+class CachedTimezoneDateTimeField(serializers.DateTimeField):
+    """
+    DateTimeField that resolves the output timezone once per field instance.
+
+    The stock field calls timezone.get_current_timezone() for every value;
+    the child of a list serializer renders a whole column with one field
+    instance, and the active timezone doesn't change mid-response.
+    """
+
+    def enforce_timezone(self, value):
+        if not hasattr(self, 'timezone'):
+            self.timezone = self.default_timezone()
+        return super().enforce_timezone(value)
+
+
+class CachedTimezoneMixin:
+    """ModelSerializer mixin that renders model DateTimeFields with CachedTimezoneDateTimeField"""
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.DateTimeField: CachedTimezoneDateTimeField,
+    }
+
+
+class ChoiceLabelField(serializers.ReadOnlyField):
+    """
+    Read-only label for a choices field (what get_FOO_display() returns),
+    looked up in a dict built once instead of scanning the choices per call.
+    """
+
+    def __init__(self, choices, **kwargs):
+        self.labels = dict(choices)
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return self.labels.get(value, value)
+
+
 # =====================
 # DEPARTMENT & PRODUCT SERIALIZERS
 # =====================
 
-class DepartmentSerializer(serializers.ModelSerializer):
+class UserFKMinimalSerializer(serializers.ModelSerializer):
+    """Identity-only user info for FKs that don't need department details"""
+    _get = operator.attrgetter('id', 'username', 'first_name', 'last_name', 'role')
+
+    class Meta:
+        model = User
+        fields = ('id', 'username', 'first_name', 'last_name', 'role')
+
+    def to_representation(self, instance):
+        # Fast path: one attrgetter call instead of per-field get_attribute
+        pk, username, first_name, last_name, role = self._get(instance)
+        return {'id': pk, 'username': username, 'first_name': first_name,
+                'last_name': last_name, 'role': role}
+
+
+class DepartmentSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for departments"""
-    manager = serializers.SerializerMethodField()
+    manager = UserFKMinimalSerializer(read_only=True)
     manager_id = serializers.PrimaryKeyRelatedField(
         queryset=User.objects.all(),
         source='manager',
@@ -24,83 +168,123 @@ class DepartmentSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Department
-        fields = ['id', 'name', 'description', 'manager', 'manager_id', 'is_creative', 'is_active', 'member_count', 'created_at']
-        read_only_fields = ['id', 'created_at']
-
-    def get_manager(self, obj):
-        if obj.manager:
-            return {
-                'id': obj.manager.id,
-                'username': obj.manager.username,
-                'first_name': obj.manager.first_name,
-                'last_name': obj.manager.last_name,
-                'role': obj.manager.role
-            }
-        return None
+        fields = ('id', 'name', 'description', 'manager', 'manager_id', 'is_creative', 'is_active', 'member_count', 'created_at')
+        read_only_fields = ('id', 'created_at')
+
+    select_related_fields = ('manager',)
+    annotations = {'member_count_annotated': Count('members')}
 
     def get_member_count(self, obj):
+        # Use annotated count if available, otherwise fallback to query
+        if hasattr(obj, 'member_count_annotated'):
+            return obj.member_count_annotated
         return obj.members.count()
 
 
 class DepartmentMinimalSerializer(serializers.ModelSerializer):
     """Minimal department info for nested serialization"""
+    _get = operator.attrgetter('id', 'name', 'is_creative')
+
     class Meta:
         model = Department
-        fields = ['id', 'name', 'is_creative']
+        fields = ('id', 'name', 'is_creative')
 
+    def to_representation(self, instance):
+        # Fast path: one attrgetter call instead of per-field get_attribute
+        pk, name, is_creative = self._get(instance)
+        return {'id': pk, 'name': name, 'is_creative': is_creative}
 
-class ProductSerializer(serializers.ModelSerializer):
-    """Serializer for products"""
+
+class ProductSerializer(DynamicFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
+    """Serializer for products (supports ?fields= to narrow the payload)"""
     ticket_count = serializers.SerializerMethodField()
-    category_display = serializers.CharField(source='get_category_display', read_only=True)
+    category_display = ChoiceLabelField(Product.Category.choices, source='category')
 
     class Meta:
         model = Product
-        fields = ['id', 'name', 'description', 'category', 'category_display', 'is_active', 'ticket_count', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        fields = ('id', 'name', 'description', 'category', 'category_display', 'is_active', 'ticket_count', 'created_at')
+        read_only_fields = ('id', 'created_at')
+
+    annotations = {'ticket_count_annotated': Count('tickets')}
 
     def get_ticket_count(self, obj):
+        # Use annotated count if available, otherwise fallback to query
+        if hasattr(obj, 'ticket_count_annotated'):
+            return obj.ticket_count_annotated
         return obj.tickets.count()
 
 
 class ProductMinimalSerializer(serializers.ModelSerializer):
     """Minimal product info for nested serialization"""
+    _get = operator.attrgetter('id', 'name', 'category')
+
     class Meta:
         model = Product
-        fields = ['id', 'name', 'category']
+        fields = ('id', 'name', 'category')
+
+    def to_representation(self, instance):
+        # Fast path: one attrgetter call instead of per-field get_attribute
+        pk, name, category = self._get(instance)
+        return {'id': pk, 'name': name, 'category': category}
 
 
-class TicketProductItemSerializer(serializers.ModelSerializer):
+class TicketProductItemSerializer(CachedTimezoneMixin, serializers.ModelSerializer):
     """Serializer for ticket product items (Ads/Telegram multi-product)"""
     product_name = serializers.CharField(source='product.name', read_only=True)
     product_category = serializers.CharField(source='product.category', read_only=True)
 
     class Meta:
         model = TicketProductItem
-        fields = ['id', 'product', 'product_name', 'product_category', 'quantity', 'criteria', 'created_at']
-        read_only_fields = ['id', 'product_name', 'product_category', 'criteria', 'created_at']
+        fields = ('id', 'product', 'product_name', 'product_category', 'quantity', 'criteria', 'created_at')
+        read_only_fields = ('id', 'product_name', 'product_category', 'criteria', 'created_at')
+
+    def to_representation(self, instance):
+        # Fast path like the minimal serializers: items are listed on every
+        # ticket row, with product loaded by select_related in the prefetch
+        product = instance.product
+        return {
+            'id': instance.id,
+            'product': instance.product_id,
+            'product_name': product.name,
+            'product_category': product.category,
+            'quantity': instance.quantity,
+            'criteria': instance.criteria,
+            'created_at': self.fields['created_at'].to_representation(instance.created_at),
+        }
 
 
 class TicketProductItemCreateSerializer(serializers.Serializer):
     """Serializer for creating product items within ticket creation"""
-    product = serializers.PrimaryKeyRelatedField(queryset=Product.objects.all())
+    # Product ids are resolved in one query by TicketCreateSerializer.validate_product_items
+    product = serializers.IntegerField()
     quantity = serializers.IntegerField(min_value=1, max_value=1000, default=1)
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for user details"""
-    approved_by_name = serializers.CharField(source='approved_by.username', read_only=True, allow_null=True)
+    approved_by_name = serializers.SerializerMethodField()
     user_department_info = DepartmentMinimalSerializer(source='user_department', read_only=True)
 
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'first_name', 'last_name',
+        fields = ('id', 'username', 'email', 'first_name', 'last_name',
                   'role', 'user_department', 'user_department_info', 'department',
                   'telegram_id', 'is_approved', 'approved_by', 'approved_by_name',
                   'approved_at', 'date_joined', 'is_active',
-                  'is_locked', 'locked_at', 'failed_login_attempts']
-        read_only_fields = ['id', 'date_joined', 'approved_by', 'approved_by_name', 'approved_at',
-                           'is_locked', 'locked_at', 'failed_login_attempts']
+                  'is_locked', 'locked_at', 'failed_login_attempts')
+        read_only_fields = ('id', 'date_joined', 'approved_by', 'approved_by_name', 'approved_at',
+                           'is_locked', 'locked_at', 'failed_login_attempts')
+
+    select_related_fields = ('user_department', 'approved_by')
+    only_fields = ('id', 'username', 'email', 'first_name', 'last_name', 'role',
+                   'user_department__id', 'user_department__name', 'user_department__is_creative',
+                   'department', 'telegram_id', 'is_approved', 'approved_by__id', 'approved_by__username',
+                   'approved_at', 'date_joined', 'is_active', 'is_locked', 'locked_at',
+                   'failed_login_attempts')
+
+    def get_approved_by_name(self, obj):
+        # approved_by is joined by setup_eager_loading
+        return obj.approved_by.username if obj.approved_by_id else None
 
 
 class UserManagementSerializer(serializers.ModelSerializer):
@@ -108,9 +292,9 @@ class UserManagementSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'first_name', 'last_name',
-                  'role', 'user_department', 'department', 'is_approved', 'is_active']
-        read_only_fields = ['id', 'username', 'email']
+        fields = ('id', 'username', 'email', 'first_name', 'last_name',
+                  'role', 'user_department', 'department', 'is_approved', 'is_active')
+        read_only_fields = ('id', 'username', 'email')
 
 
 class UserCreateSerializer(serializers.ModelSerializer):
@@ -126,8 +310,8 @@ class UserCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = ['username', 'email', 'password', 'password_confirm',
-                  'first_name', 'last_name', 'user_department', 'telegram_id']
+        fields = ('username', 'email', 'password', 'password_confirm',
+                  'first_name', 'last_name', 'user_department', 'telegram_id')
 
     def validate(self, attrs):
         if attrs['password'] != attrs['password_confirm']:
@@ -166,100 +350,299 @@ class UpdateUserProfileSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = ['first_name', 'last_name', 'email', 'telegram_id', 'user_department']
+        fields = ('first_name', 'last_name', 'email', 'telegram_id', 'user_department')
+
+
+# Columns read by the minimal nested serializers, for only_fields on
+# select_related chains (skips password hashes, emails, descriptions...)
+USER_MINIMAL_COLUMNS = ('id', 'username', 'first_name', 'last_name', 'role',
+                        'user_department__id', 'user_department__name', 'user_department__is_creative')
+DEPARTMENT_MINIMAL_COLUMNS = ('id', 'name', 'is_creative')
+PRODUCT_MINIMAL_COLUMNS = ('id', 'name', 'category')
 
 
-class UserMinimalSerializer(serializers.ModelSerializer):
+def related_columns(prefix, columns):
+    """Prefix nested serializer columns with the relation they're loaded through"""
+    return tuple(f'{prefix}__{column}' for column in columns)
+
+
+class UserMinimalSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Minimal user info for nested serialization"""
     user_department_info = DepartmentMinimalSerializer(source='user_department', read_only=True)
+    _get = operator.attrgetter('id', 'username', 'first_name', 'last_name', 'role', 'user_department_id')
 
     class Meta:
         model = User
-        fields = ['id', 'username', 'first_name', 'last_name', 'role', 'user_department', 'user_department_info']
+        fields = ('id', 'username', 'first_name', 'last_name', 'role', 'user_department', 'user_department_info')
+
+    select_related_fields = ('user_department',)
+    only_fields = USER_MINIMAL_COLUMNS
+
+    def to_representation(self, instance):
+        # The same users recur across rows (requester, assignee, approver...),
+        # so build each payload once per request and reuse it
+        return _user_minimal(instance, self.context)
+
+    def _build(self, instance, dept_cache):
+        # Fast path: one attrgetter call instead of per-field get_attribute
+        pk, username, first_name, last_name, role, department_id = self._get(instance)
+        if department_id is None:
+            department_info = None
+        else:
+            # Many users share a department; build its dict once as well
+            department_info = dept_cache.get(department_id)
+            if department_info is None:
+                department_info = dept_cache[department_id] = (
+                    self.fields['user_department_info'].to_representation(instance.user_department)
+                )
+        return {
+            'id': pk,
+            'username': username,
+            'first_name': first_name,
+            'last_name': last_name,
+            'role': role,
+            'user_department': department_id,
+            'user_department_info': department_info,
+        }
+
+
+_user_minimal_serializer = UserMinimalSerializer()
+
+
+def _user_minimal(user, context):
+    """
+    Build the UserMinimalSerializer payload once per user and reuse it.
+    Users and departments are memoized in the serializer context, which is
+    shared by every nested serializer in a response.
+    """
+    if user is None:
+        return None
+    cache = context.setdefault('_user_cache', {})
+    if user.id not in cache:
+        cache[user.id] = _user_minimal_serializer._build(user, context.setdefault('_dept_cache', {}))
+    return cache[user.id]
+
+
+_CRITERIA_LABELS = dict(Ticket.Criteria.choices)
+
+# criteria_display computed in SQL (annotated as criteria_display_annotated);
+# tickets created before criteria existed show as Video
+CRITERIA_DISPLAY = Case(
+    When(criteria='', then=Value(_CRITERIA_LABELS[Ticket.Criteria.VIDEO])),
+    *[When(criteria=value, then=Value(label)) for value, label in _CRITERIA_LABELS.items()],
+    default=F('criteria'),
+    output_field=CharField(),
+)
+
+
+# Ticket.is_overdue / Ticket.is_idle evaluated in SQL (annotated as
+# is_overdue_annotated / is_idle_annotated), same rules as the properties
+IS_OVERDUE = Case(
+    When(
+        Q(deadline__lt=Now()) & ~Q(status__in=[Ticket.Status.COMPLETED, Ticket.Status.REJECTED]),
+        then=Value(True)
+    ),
+    default=Value(False),
+    output_field=BooleanField(),
+)
+IS_IDLE = Case(
+    When(status=Ticket.Status.IN_PROGRESS, updated_at__lte=Now() - timedelta(days=1), then=Value(True)),
+    default=Value(False),
+    output_field=BooleanField(),
+)
+
+
+def ticket_count_subquery(model):
+    """
+    Per-ticket row count of ``model`` as a correlated subquery.
+
+    Used instead of Count() over joins: several Count()s on one queryset
+    multiply the joined rows and need DISTINCT to come out right.
+    """
+    counts = model.objects.filter(ticket=OuterRef('pk')).order_by().values('ticket').annotate(
+        count=Count('*')
+    ).values('count')
+    return Coalesce(Subquery(counts), 0)
+
+
+def _criteria_display(ticket):
+    """criteria_display from the annotation, or computed the same way in Python"""
+    if hasattr(ticket, 'criteria_display_annotated'):
+        return ticket.criteria_display_annotated
+    # Default to "Video" for old tickets without criteria set
+    if ticket.criteria:
+        return _CRITERIA_LABELS.get(ticket.criteria, ticket.criteria)
+    return _CRITERIA_LABELS[Ticket.Criteria.VIDEO]
+
+
+def comment_thread_queryset():
+    """Top-level comments with authors, replies prefetched into cached_replies"""
+    replies = TicketComment.objects.select_related('user', 'user__user_department')
+    return TicketComment.objects.filter(parent__isnull=True).select_related(
+        'user', 'user__user_department'
+    ).prefetch_related(
+        Prefetch('replies', queryset=replies, to_attr='cached_replies')
+    )
 
 
-class TicketCommentSerializer(serializers.ModelSerializer):
-    """Serializer for ticket comments with replies"""
-    user = UserMinimalSerializer(read_only=True)
-    replies = serializers.SerializerMethodField()
+class ReplyCommentSerializer(CachedTimezoneMixin, serializers.ModelSerializer):
+    """Serializer for comment replies (replies are one level deep, so no replies field)"""
+    user = serializers.SerializerMethodField()
 
     class Meta:
         model = TicketComment
-        fields = ['id', 'ticket', 'user', 'parent', 'comment', 'created_at', 'replies']
-        read_only_fields = ['id', 'ticket', 'user', 'created_at']
+        fields = ('id', 'ticket', 'user', 'parent', 'comment', 'created_at')
+        read_only_fields = ('id', 'ticket', 'user', 'created_at')
+
+    def get_user(self, obj):
+        return _user_minimal(obj.user, self.context)
+
+
+class TicketCommentSerializer(ReplyCommentSerializer):
+    """Serializer for top-level ticket comments with their replies"""
+    replies = serializers.SerializerMethodField()
+    # Reply list serializer, built once and reused for every comment row
+    _reply_list = None
+
+    class Meta(ReplyCommentSerializer.Meta):
+        fields = ReplyCommentSerializer.Meta.fields + ('replies',)
 
     def get_replies(self, obj):
-        # Only get replies for top-level comments (no parent)
-        if obj.parent is None:
+        if self._reply_list is None:
+            self._reply_list = ReplyCommentSerializer(many=True, read_only=True, context=self.context)
+        # Prefer replies prefetched by comment_thread_queryset()
+        replies = getattr(obj, 'cached_replies', None)
+        if replies is None:
             replies = obj.replies.all()
-            return TicketCommentSerializer(replies, many=True).data
-        return []
+        return self._reply_list.to_representation(replies)
 
 
-class TicketAttachmentSerializer(serializers.ModelSerializer):
+class TicketAttachmentSerializer(EagerLoadingMixin, CachedTimezoneMixin, serializers.ModelSerializer):
     """Serializer for ticket attachments"""
-    user = UserMinimalSerializer(read_only=True)
+    user = serializers.SerializerMethodField()
 
     class Meta:
         model = TicketAttachment
-        fields = ['id', 'ticket', 'user', 'file', 'file_name', 'uploaded_at']
-        read_only_fields = ['id', 'ticket', 'user', 'file_name', 'uploaded_at']
+        fields = ('id', 'ticket', 'user', 'file', 'file_name', 'uploaded_at')
+        read_only_fields = ('id', 'ticket', 'user', 'file_name', 'uploaded_at')
+
+    select_related_fields = ('user__user_department',)
+
+    def get_user(self, obj):
+        return _user_minimal(obj.user, self.context)
 
 
-class TicketCollaboratorSerializer(serializers.ModelSerializer):
+class TicketCollaboratorSerializer(EagerLoadingMixin, CachedTimezoneMixin, serializers.ModelSerializer):
     """Serializer for ticket collaborators"""
-    user = UserMinimalSerializer(read_only=True)
-    added_by = UserMinimalSerializer(read_only=True)
+    user = serializers.SerializerMethodField()
+    added_by = serializers.SerializerMethodField()
 
     class Meta:
         model = TicketCollaborator
-        fields = ['id', 'ticket', 'user', 'added_by', 'added_at']
-        read_only_fields = ['id', 'added_by', 'added_at']
+        fields = ('id', 'ticket', 'user', 'added_by', 'added_at')
+        read_only_fields = ('id', 'added_by', 'added_at')
+
+    select_related_fields = ('user__user_department', 'added_by__user_department')
+
+    def get_user(self, obj):
+        return _user_minimal(obj.user, self.context)
 
+    def get_added_by(self, obj):
+        return _user_minimal(obj.added_by, self.context)
 
-class TicketListSerializer(serializers.ModelSerializer):
-    """Serializer for ticket list view"""
+
+class TicketListSerializer(DynamicFieldsMixin, EagerLoadingMixin, CachedTimezoneMixin, serializers.ModelSerializer):
+    """Serializer for ticket list view (supports ?fields= to narrow the payload)"""
     requester = UserMinimalSerializer(read_only=True)
     assigned_to = UserMinimalSerializer(read_only=True)
     pending_approver = UserMinimalSerializer(read_only=True)
     ticket_product = ProductMinimalSerializer(read_only=True)
     target_department = DepartmentMinimalSerializer(read_only=True)
     collaborators = TicketCollaboratorSerializer(many=True, read_only=True)
-    is_overdue = serializers.BooleanField(read_only=True)
+    is_overdue = serializers.SerializerMethodField()
     # Use annotated counts from queryset to avoid N+1 queries
     comment_count = serializers.SerializerMethodField()
     attachment_count = serializers.SerializerMethodField()
-    request_type_display = serializers.CharField(source='get_request_type_display', read_only=True)
-    file_format_display = serializers.CharField(source='get_file_format_display', read_only=True)
+    request_type_display = ChoiceLabelField(Ticket.RequestType.choices, source='request_type')
+    file_format_display = ChoiceLabelField(Ticket.FileFormat.choices, source='file_format')
     criteria_display = serializers.SerializerMethodField()
     product_items = TicketProductItemSerializer(many=True, read_only=True)
 
     class Meta:
         model = Ticket
-        fields = ['id', 'title', 'requester', 'assigned_to', 'pending_approver',
+        fields = ('id', 'title', 'requester', 'assigned_to', 'pending_approver',
                   'status', 'priority', 'deadline', 'created_at', 'is_overdue',
                   'comment_count', 'attachment_count', 'ticket_product', 'target_department',
                   'product', 'department', 'is_deleted', 'deleted_at',
                   'request_type', 'request_type_display', 'file_format', 'file_format_display',
                   'revision_count', 'quantity', 'criteria', 'criteria_display', 'product_items',
-                  'collaborators']
+                  'collaborators')
+
+    select_related_fields = (
+        'requester', 'requester__user_department',
+        'assigned_to', 'assigned_to__user_department',
+        'pending_approver', 'pending_approver__user_department',
+        'ticket_product',
+        'target_department',
+    )
+    annotations = {
+        # Annotate counts to avoid N+1 queries in serializers
+        'comment_count_annotated': ticket_count_subquery(TicketComment),
+        'attachment_count_annotated': ticket_count_subquery(TicketAttachment),
+        'criteria_display_annotated': CRITERIA_DISPLAY,
+        'is_overdue_annotated': IS_OVERDUE,
+    }
+    only_fields = (
+        'id', 'title', 'status', 'priority', 'deadline', 'created_at',
+        'product', 'department', 'is_deleted', 'deleted_at',
+        'request_type', 'file_format', 'revision_count', 'quantity', 'criteria',
+        *related_columns('requester', USER_MINIMAL_COLUMNS),
+        *related_columns('assigned_to', USER_MINIMAL_COLUMNS),
+        *related_columns('pending_approver', USER_MINIMAL_COLUMNS),
+        *related_columns('ticket_product', PRODUCT_MINIMAL_COLUMNS),
+        *related_columns('target_department', DEPARTMENT_MINIMAL_COLUMNS),
+    )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None):
+        """Declared joins/counts plus the nested collaborator and product item lists"""
+        queryset = super().setup_eager_loading(queryset, fields)
+        if fields is None or 'collaborators' in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch('collaborators', queryset=TicketCollaborator.objects.select_related(
+                    'user__user_department', 'added_by__user_department'
+                ))
+            )
+        if fields is None or 'product_items' in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch('product_items', queryset=TicketProductItem.objects.select_related('product'))
+            )
+        return queryset
+
+    def get_is_overdue(self, obj):
+        # Use the SQL annotation if available, otherwise the model property
+        if hasattr(obj, 'is_overdue_annotated'):
+            return obj.is_overdue_annotated
+        return obj.is_overdue
 
     def get_comment_count(self, obj):
         # Use annotated count if available, otherwise fallback to query
-        return getattr(obj, 'comment_count_annotated', obj.comments.count())
+        # (not a getattr default, which would run the query on every row)
+        if hasattr(obj, 'comment_count_annotated'):
+            return obj.comment_count_annotated
+        return obj.comments.count()
 
     def get_attachment_count(self, obj):
         # Use annotated count if available, otherwise fallback to query
-        return getattr(obj, 'attachment_count_annotated', obj.attachments.count())
+        if hasattr(obj, 'attachment_count_annotated'):
+            return obj.attachment_count_annotated
+        return obj.attachments.count()
 
     def get_criteria_display(self, obj):
-        # Default to "Video" for old tickets without criteria set
-        if obj.criteria:
-            return obj.get_criteria_display()
-        return 'Video'
+        return _criteria_display(obj)
 
 
-class TicketDetailSerializer(serializers.ModelSerializer):
+class TicketDetailSerializer(EagerLoadingMixin, CachedTimezoneMixin, serializers.ModelSerializer):
     """Serializer for ticket detail view"""
     requester = UserMinimalSerializer(read_only=True)
     assigned_to = UserMinimalSerializer(read_only=True)
@@ -270,17 +653,17 @@ class TicketDetailSerializer(serializers.ModelSerializer):
     comments = serializers.SerializerMethodField()
     attachments = TicketAttachmentSerializer(many=True, read_only=True)
     collaborators = TicketCollaboratorSerializer(many=True, read_only=True)
-    is_overdue = serializers.BooleanField(read_only=True)
-    is_idle = serializers.BooleanField(read_only=True)
+    is_overdue = serializers.SerializerMethodField()
+    is_idle = serializers.SerializerMethodField()
     deleted_by = UserMinimalSerializer(read_only=True)
-    request_type_display = serializers.CharField(source='get_request_type_display', read_only=True)
-    file_format_display = serializers.CharField(source='get_file_format_display', read_only=True)
+    request_type_display = ChoiceLabelField(Ticket.RequestType.choices, source='request_type')
+    file_format_display = ChoiceLabelField(Ticket.FileFormat.choices, source='file_format')
     criteria_display = serializers.SerializerMethodField()
     product_items = TicketProductItemSerializer(many=True, read_only=True)
 
     class Meta:
         model = Ticket
-        fields = ['id', 'title', 'description', 'requester', 'assigned_to',
+        fields = ('id', 'title', 'description', 'requester', 'assigned_to',
                   'approver', 'pending_approver', 'status', 'priority', 'deadline',
                   'created_at', 'updated_at', 'is_overdue', 'is_idle', 'comments',
                   'attachments', 'collaborators', 'confirmed_by_requester', 'confirmed_at',
@@ -290,18 +673,89 @@ class TicketDetailSerializer(serializers.ModelSerializer):
                   'complexity', 'estimated_hours', 'actual_hours',
                   'is_deleted', 'deleted_at', 'deleted_by',
                   'request_type', 'request_type_display', 'file_format', 'file_format_display',
-                  'revision_count', 'quantity', 'criteria', 'criteria_display', 'product_items']
+                  'revision_count', 'quantity', 'criteria', 'criteria_display', 'product_items')
+
+    # Served by /tickets/<id>/attachments/ and /tickets/<id>/collaborators/;
+    # only inlined when asked for with ?include=attachments,collaborators
+    INCLUDABLE_FIELDS = ('attachments', 'collaborators')
+
+    select_related_fields = (
+        'requester', 'requester__user_department',
+        'assigned_to', 'assigned_to__user_department',
+        'approver', 'approver__user_department',
+        'pending_approver', 'pending_approver__user_department',
+        'deleted_by', 'deleted_by__user_department',
+        'ticket_product',
+        'target_department',
+    )
+    annotations = {
+        'criteria_display_annotated': CRITERIA_DISPLAY,
+        'is_overdue_annotated': IS_OVERDUE,
+        'is_idle_annotated': IS_IDLE,
+    }
+    only_fields = (
+        'id', 'title', 'description', 'status', 'priority', 'deadline',
+        'created_at', 'updated_at', 'confirmed_by_requester', 'confirmed_at',
+        'approved_at', 'rejected_at', 'assigned_at', 'started_at', 'completed_at',
+        'scheduled_start', 'scheduled_end', 'actual_end', 'product', 'department',
+        'complexity', 'estimated_hours', 'actual_hours', 'is_deleted', 'deleted_at',
+        'request_type', 'file_format', 'revision_count', 'quantity', 'criteria',
+        *related_columns('requester', USER_MINIMAL_COLUMNS),
+        *related_columns('assigned_to', USER_MINIMAL_COLUMNS),
+        *related_columns('approver', USER_MINIMAL_COLUMNS),
+        *related_columns('pending_approver', USER_MINIMAL_COLUMNS),
+        *related_columns('deleted_by', USER_MINIMAL_COLUMNS),
+        *related_columns('ticket_product', PRODUCT_MINIMAL_COLUMNS),
+        *related_columns('target_department', DEPARTMENT_MINIMAL_COLUMNS),
+    )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None, include=()):
+        """
+        Declared joins plus the nested lists, including the comment thread.
+        Attachments and collaborators are only prefetched when named in include.
+        """
+        prefetches = [
+            Prefetch('product_items', queryset=TicketProductItem.objects.select_related('product')),
+            Prefetch('comments', queryset=comment_thread_queryset(), to_attr='top_level_comments'),
+        ]
+        if 'attachments' in include:
+            attachments = TicketAttachmentSerializer.setup_eager_loading(TicketAttachment.objects.all())
+            prefetches.append(Prefetch('attachments', queryset=attachments))
+        if 'collaborators' in include:
+            collaborators = TicketCollaboratorSerializer.setup_eager_loading(TicketCollaborator.objects.all())
+            prefetches.append(Prefetch('collaborators', queryset=collaborators))
+        return super().setup_eager_loading(queryset, fields).prefetch_related(*prefetches)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        included = included_fields(self.context.get('request'))
+        for field_name in self.INCLUDABLE_FIELDS:
+            if field_name not in included:
+                self.fields.pop(field_name)
+
+    def get_is_overdue(self, obj):
+        # Use the SQL annotation if available, otherwise the model property
+        if hasattr(obj, 'is_overdue_annotated'):
+            return obj.is_overdue_annotated
+        return obj.is_overdue
+
+    def get_is_idle(self, obj):
+        if hasattr(obj, 'is_idle_annotated'):
+            return obj.is_idle_annotated
+        return obj.is_idle
 
     def get_comments(self, obj):
         # Only return top-level comments (replies are nested within them)
-        top_level_comments = obj.comments.filter(parent__isnull=True)
-        return TicketCommentSerializer(top_level_comments, many=True).data
+        # Prefetched by setup_eager_loading (with replies and authors); tickets
+        # serialized after an action load the same thread in two queries
+        top_level_comments = getattr(obj, 'top_level_comments', None)
+        if top_level_comments is None:
+            top_level_comments = comment_thread_queryset().filter(ticket=obj)
+        return TicketCommentSerializer(top_level_comments, many=True, context=self.context).data
 
     def get_criteria_display(self, obj):
-        # Default to "Video" for old tickets without criteria set
-        if obj.criteria:
-            return obj.get_criteria_display()
-        return 'Video'
+        return _criteria_display(obj)
 
 
 class TicketCreateSerializer(serializers.ModelSerializer):
@@ -310,11 +764,26 @@ class TicketCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Ticket
-        fields = ['id', 'title', 'description', 'priority', 'assigned_to',
+        fields = ('id', 'title', 'description', 'priority', 'assigned_to',
                   'ticket_product', 'target_department', 'product', 'department',
                   'complexity', 'estimated_hours', 'request_type', 'file_format',
-                  'quantity', 'criteria', 'product_items']
-        read_only_fields = ['id']
+                  'quantity', 'criteria', 'product_items')
+        read_only_fields = ('id',)
+
+    def validate_product_items(self, product_items):
+        # Look up every item's product at once instead of one query per item
+        products = Product.objects.in_bulk({item['product'] for item in product_items})
+        errors = [
+            {} if item['product'] in products else {
+                'product': [f'Invalid pk "{item["product"]}" - object does not exist.']
+            }
+            for item in product_items
+        ]
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        for item in product_items:
+            item['product'] = products[item['product']]
+        return product_items
 
     def validate(self, attrs):
         request_type = attrs.get('request_type', '')
@@ -361,13 +830,19 @@ class TicketCreateSerializer(serializers.ModelSerializer):
         validated_data['requester'] = self.context['request'].user
         ticket = super().create(validated_data)
 
-        # Create product items for Ads/Telegram requests
-        for item_data in product_items_data:
-            TicketProductItem.objects.create(
+        # Create product items for Ads/Telegram requests in one INSERT
+        # (bulk_create skips save(), so criteria is defaulted here)
+        items = [
+            TicketProductItem(
                 ticket=ticket,
                 product=item_data['product'],
                 quantity=item_data.get('quantity', 1)
             )
+            for item_data in product_items_data
+        ]
+        for item in items:
+            item.set_default_criteria()
+        TicketProductItem.objects.bulk_create(items)
 
         return ticket
 
@@ -377,11 +852,11 @@ class TicketUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Ticket
-        fields = ['title', 'description', 'priority', 'assigned_to',
+        fields = ('title', 'description', 'priority', 'assigned_to',
                   'ticket_product', 'target_department', 'product', 'department',
                   'complexity', 'estimated_hours', 'actual_hours',
                   'is_deleted', 'deleted_at', 'deleted_by',
-                  'request_type', 'file_format', 'quantity', 'criteria']
+                  'request_type', 'file_format', 'quantity', 'criteria')
 
 
 class RevisionRequestSerializer(serializers.Serializer):
@@ -401,16 +876,24 @@ class TicketRejectSerializer(serializers.Serializer):
     reason = serializers.CharField(required=False, allow_blank=True)
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(EagerLoadingMixin, CachedTimezoneMixin, serializers.ModelSerializer):
     """Serializer for notifications"""
-    ticket_title = serializers.CharField(source='ticket.title', read_only=True)
+    ticket_title = serializers.SerializerMethodField()
 
     class Meta:
         model = Notification
-        fields = ['id', 'ticket', 'ticket_title', 'message', 'notification_type',
-                  'is_read', 'telegram_sent', 'created_at']
-        read_only_fields = ['id', 'ticket', 'message', 'notification_type',
-                           'telegram_sent', 'created_at']
+        fields = ('id', 'ticket', 'ticket_title', 'message', 'notification_type',
+                  'is_read', 'telegram_sent', 'created_at')
+        read_only_fields = ('id', 'ticket', 'message', 'notification_type',
+                           'telegram_sent', 'created_at')
+
+    annotations = {'ticket_title': F('ticket__title')}
+
+    def get_ticket_title(self, obj):
+        # Use the queryset annotation when present to skip the ticket lookup
+        if hasattr(obj, 'ticket_title'):
+            return obj.ticket_title
+        return obj.ticket.title if obj.ticket_id else None
 
 
 class DashboardStatsSerializer(serializers.Serializer):
@@ -422,16 +905,67 @@ class DashboardStatsSerializer(serializers.Serializer):
     overdue = serializers.IntegerField()
     my_assigned = serializers.IntegerField()
 
-
-class ActivityLogSerializer(serializers.ModelSerializer):
+    @staticmethod
+    def base_queryset(user):
+        """Tickets counted on the user's dashboard (all for managers, own otherwise)"""
+        if user.is_manager:
+            return Ticket.objects.filter(is_deleted=False)
+        return Ticket.objects.filter(
+            Q(requester=user) | Q(assigned_to=user),
+            is_deleted=False
+        )
+
+    @classmethod
+    def compute(cls, user, now=None):
+        """
+        Return every dashboard count for ``user`` from a single aggregate query.
+
+        Each bucket is a conditional COUNT over the same base queryset, so new
+        stats should be added here as another Count(Case(When(...))) rather
+        than as a separate query.
+        """
+        now = now or timezone.now()
+        active_statuses = [Ticket.Status.REQUESTED, Ticket.Status.PENDING_CREATIVE,
+                           Ticket.Status.APPROVED, Ticket.Status.IN_PROGRESS]
+        return cls.base_queryset(user).aggregate(
+            total=Count('id'),
+            pending_approval=Count(Case(When(status=Ticket.Status.REQUESTED, then=1))),
+            pending_creative=Count(Case(When(status=Ticket.Status.PENDING_CREATIVE, then=1))),
+            in_progress=Count(Case(When(status=Ticket.Status.IN_PROGRESS, then=1))),
+            completed=Count(Case(When(status=Ticket.Status.COMPLETED, then=1))),
+            approved=Count(Case(When(status=Ticket.Status.APPROVED, then=1))),
+            rejected=Count(Case(When(status=Ticket.Status.REJECTED, then=1))),
+            overdue=Count(Case(When(deadline__lt=now, status__in=active_statuses, then=1))),
+            # The base queryset always contains the user's assigned tickets
+            my_assigned=Count(Case(When(
+                Q(assigned_to=user) & ~Q(status__in=[Ticket.Status.COMPLETED, Ticket.Status.REJECTED]),
+                then=1
+            ))),
+            # Priority counts
+            urgent=Count(Case(When(priority='urgent', then=1))),
+            high=Count(Case(When(priority='high', then=1))),
+            medium=Count(Case(When(priority='medium', then=1))),
+            low=Count(Case(When(priority='low', then=1))),
+        )
+
+
+class ActivityLogSerializer(EagerLoadingMixin, CachedTimezoneMixin, serializers.ModelSerializer):
     """Serializer for activity logs"""
     user = UserMinimalSerializer(read_only=True)
-    ticket_title = serializers.CharField(source='ticket.title', read_only=True)
-    action_display = serializers.CharField(source='get_action_display', read_only=True)
+    ticket_title = serializers.SerializerMethodField()
+    action_display = ChoiceLabelField(ActivityLog.ActionType.choices, source='action')
 
     class Meta:
-        from .models import ActivityLog
         model = ActivityLog
-        fields = ['id', 'user', 'ticket', 'ticket_title', 'action', 'action_display', 'snapshot',
-                  'details', 'created_at']
-        read_only_fields = ['id', 'user', 'ticket', 'action', 'details', 'snapshot', 'created_at']
+        fields = ('id', 'user', 'ticket', 'ticket_title', 'action', 'action_display', 'snapshot',
+                  'details', 'created_at')
+        read_only_fields = ('id', 'user', 'ticket', 'action', 'details', 'snapshot', 'created_at')
+
+    select_related_fields = ('user', 'user__user_department')
+    annotations = {'ticket_title': F('ticket__title')}
+
+    def get_ticket_title(self, obj):
+        # Use the queryset annotation when present to skip the ticket lookup
+        if hasattr(obj, 'ticket_title'):
+            return obj.ticket_title
+        return obj.ticket.title if obj.ticket_id else None
@@ -0,0 +1,26 @@
+"""
+Model signal handlers for the api app.
+
+Connected in ApiConfig.ready().
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache_utils import APPROVED_USERS_VERSION_KEY, DASHBOARD_VERSION_KEY, bump_version
+from .models import Department, Ticket, User
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+def invalidate_dashboards(sender, **kwargs):
+    """Any ticket write can change dashboard counts; stale every cached dashboard"""
+    bump_version(DASHBOARD_VERSION_KEY)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def invalidate_approved_users(sender, **kwargs):
+    """Users and their department names make up the assignable users list"""
+    bump_version(APPROVED_USERS_VERSION_KEY)
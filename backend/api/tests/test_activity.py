@@ -6,20 +6,23 @@ import pytest
 from django.urls import reverse
 from rest_framework import status
 from api.models import ActivityLog
+from api.tests.utils import paginated
+
+ACTIVITY_LIST_URL = reverse('activity-list')
+
+pytestmark = pytest.mark.django_db
 
 
-@pytest.mark.django_db
 class TestActivityLog:
     """TC-ACTIVITY-001 to TC-ACTIVITY-002: Activity Log Tests"""
 
     def test_list_activities(self, member_client, activity_log):
         """TC-ACTIVITY-001: List activity logs"""
-        url = reverse('activity-list')
-        response = member_client.get(url)
+        response = member_client.get(ACTIVITY_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
-        activities = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        activities = paginated(response.data)
         assert len(activities) >= 1
 
     def test_activity_created_on_ticket_action(self, manager_client, ticket_requested):
@@ -36,26 +39,36 @@ class TestActivityLog:
         new_count = ActivityLog.objects.count()
         assert new_count > initial_count
 
+    def test_auto_approved_ticket_logs_both_steps(self, creative_manager_client, creative_manager,
+                                                  valid_ticket_data):
+        """Creative manager's ticket logs the auto-approval and the creation"""
+        response = creative_manager_client.post(reverse('ticket-list'), valid_ticket_data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        logs = ActivityLog.objects.filter(ticket_id=response.data['id']).order_by('id')
+        assert [log.action for log in logs] == [ActivityLog.ActionType.APPROVED,
+                                                ActivityLog.ActionType.CREATED]
+        assert all(log.user_id == creative_manager.id for log in logs)
+        assert logs[0].snapshot['status'] == 'approved'
+
     def test_activity_includes_user_info(self, member_client, activity_log):
         """Activity includes user information"""
-        url = reverse('activity-list')
-        response = member_client.get(url)
+        response = member_client.get(ACTIVITY_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
-        activities = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        activities = paginated(response.data)
         if activities:
             activity = activities[0]
             assert 'user' in activity
 
     def test_activity_includes_ticket_info(self, member_client, activity_log):
         """Activity includes ticket information"""
-        url = reverse('activity-list')
-        response = member_client.get(url)
+        response = member_client.get(ACTIVITY_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
-        activities = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        activities = paginated(response.data)
         if activities:
             activity = activities[0]
             assert 'ticket' in activity or 'ticket_id' in activity
@@ -67,12 +80,11 @@ class TestActivityLog:
         manager_client.post(url)
 
         # Filter by the actual action used in two-step workflow
-        url = reverse('activity-list')
-        response = manager_client.get(url, {'action': 'dept_approved'})
+        response = manager_client.get(ACTIVITY_LIST_URL, {'action': 'dept_approved'})
 
         assert response.status_code == status.HTTP_200_OK
 
-        activities = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        activities = paginated(response.data)
         for activity in activities:
             assert activity['action'] == 'dept_approved'
 
@@ -86,25 +98,33 @@ class TestActivityLog:
             details='Updated ticket'
         )
 
-        url = reverse('activity-list')
-        response = member_client.get(url)
+        response = member_client.get(ACTIVITY_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
-        activities = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        activities = paginated(response.data)
         if len(activities) >= 2:
             dates = [a.get('created_at', '') for a in activities]
             assert dates == sorted(dates, reverse=True)
 
+    def test_list_activities_fast(self, member_client, activity_log):
+        """?fast=1 returns flat rows without the nested user or snapshot"""
+        response = member_client.get(ACTIVITY_LIST_URL, {'fast': '1'})
+
+        assert response.status_code == status.HTTP_200_OK
+        activity = response.data[0]
+        assert activity['id'] == activity_log.id
+        assert activity['username'] == activity_log.user.username
+        assert activity['ticket_title'] == activity_log.ticket.title
+        assert 'snapshot' not in activity
+
 
-@pytest.mark.django_db
 class TestActivityAccess:
     """Activity Log Access Control Tests"""
 
     def test_activities_unauthenticated(self, api_client):
         """Unauthenticated access to activities fails"""
-        url = reverse('activity-list')
-        response = api_client.get(url)
+        response = api_client.get(ACTIVITY_LIST_URL)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
@@ -118,7 +138,6 @@ class TestActivityAccess:
             details='Created'
         )
 
-        url = reverse('activity-list')
-        response = member_client.get(url)
+        response = member_client.get(ACTIVITY_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
@@ -7,9 +7,11 @@ from django.urls import reverse
 from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework import status
 from api.models import TicketAttachment
+from api.tests.utils import paginated
+
+pytestmark = pytest.mark.django_db
 
 
-@pytest.mark.django_db
 class TestTicketAttachments:
     """TC-ATTACH-001 to TC-ATTACH-003: Attachment Tests"""
 
@@ -47,9 +49,26 @@ class TestTicketAttachments:
 
         assert response.status_code == status.HTTP_200_OK
 
-        attachments = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        attachments = paginated(response.data)
         assert len(attachments) >= 1
 
+    @pytest.mark.parametrize('uploads', [1, 3])
+    def test_list_attachments_query_count(self, manager_client, ticket_requested, admin_user,
+                                          member_user, creative_user, uploads,
+                                          django_assert_num_queries):
+        """Uploaders are joined in: the ticket and the list, however many rows"""
+        for user in (admin_user, member_user, creative_user)[:uploads]:
+            TicketAttachment.objects.create(
+                ticket=ticket_requested, user=user, file='test/path.txt', file_name='test.txt'
+            )
+
+        url = reverse('ticket-attachments', kwargs={'pk': ticket_requested.id})
+        with django_assert_num_queries(2):
+            response = manager_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(paginated(response.data)) == uploads
+
     def test_delete_own_attachment(self, member_client, ticket_requested, member_user):
         """TC-ATTACH-002: User can delete their own attachment"""
         # Create an attachment owned by the member
@@ -6,9 +6,11 @@ import pytest
 from django.urls import reverse
 from rest_framework import status
 from api.models import TicketCollaborator
+from api.tests.utils import paginated
+
+pytestmark = pytest.mark.django_db
 
 
-@pytest.mark.django_db
 class TestTicketCollaborators:
     """Ticket Collaborator Tests"""
 
@@ -16,7 +18,7 @@ class TestTicketCollaborators:
         """Add collaborator to ticket"""
         url = reverse('ticket-collaborators', kwargs={'pk': ticket_approved.id})
         data = {'user_id': member_user.id}
-        response = manager_client.post(url, data, format='json')
+        response = manager_client.post(url, data)
 
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['user']['id'] == member_user.id
@@ -29,15 +31,30 @@ class TestTicketCollaborators:
 
         assert response.status_code == status.HTTP_200_OK
 
-        collaborators = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        collaborators = paginated(response.data)
         assert len(collaborators) >= 1
 
+    @pytest.mark.parametrize('count', [1, 3])
+    def test_list_collaborators_query_count(self, manager_client, ticket_approved, manager_user,
+                                            admin_user, member_user, creative_user, count,
+                                            django_assert_num_queries):
+        """Collaborators and whoever added them are joined in: the ticket and the list"""
+        for user in (admin_user, member_user, creative_user)[:count]:
+            TicketCollaborator.objects.create(ticket=ticket_approved, user=user, added_by=manager_user)
+
+        url = reverse('ticket-collaborators', kwargs={'pk': ticket_approved.id})
+        with django_assert_num_queries(2):
+            response = manager_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(paginated(response.data)) == count
+
     def test_remove_collaborator(self, manager_client, ticket_with_collaborator):
         """Remove collaborator from ticket"""
         ticket, collaborator = ticket_with_collaborator
         url = reverse('ticket-collaborators', kwargs={'pk': ticket.id})
         data = {'user_id': collaborator.user.id}
-        response = manager_client.delete(url, data, format='json')
+        response = manager_client.delete(url, data)
 
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_204_NO_CONTENT]
 
@@ -49,7 +66,7 @@ class TestTicketCollaborators:
         ticket, collaborator = ticket_with_collaborator
         url = reverse('ticket-collaborators', kwargs={'pk': ticket.id})
         data = {'user_id': collaborator.user.id}
-        response = manager_client.post(url, data, format='json')
+        response = manager_client.post(url, data)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -57,7 +74,7 @@ class TestTicketCollaborators:
         """Regular member cannot add collaborators"""
         url = reverse('ticket-collaborators', kwargs={'pk': ticket_approved.id})
         data = {'user_id': admin_user.id}
-        response = member_client.post(url, data, format='json')
+        response = member_client.post(url, data)
 
         # May be 403 or allowed depending on business rules
         # Just verify it doesn't error
@@ -2,9 +2,19 @@
 Dashboard Tests (TC-DASH)
 Tests for dashboard statistics and data
 """
+from datetime import timedelta
+
 import pytest
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
+from api.models import Ticket
+from api.tests.utils import paginated
+
+DASHBOARD_STATS_URL = reverse('dashboard-stats')
+MY_TASKS_URL = reverse('my-tasks')
+TEAM_OVERVIEW_URL = reverse('team-overview')
+OVERDUE_TICKETS_URL = reverse('overdue-tickets')
 
 
 @pytest.mark.django_db
@@ -13,8 +23,7 @@ class TestDashboardStats:
 
     def test_get_dashboard_stats(self, member_client):
         """TC-DASH-001: Get dashboard statistics"""
-        url = reverse('dashboard-stats')
-        response = member_client.get(url)
+        response = member_client.get(DASHBOARD_STATS_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
@@ -25,8 +34,7 @@ class TestDashboardStats:
 
     def test_dashboard_stats_with_tickets(self, member_client, multiple_tickets):
         """Dashboard stats reflect actual ticket counts"""
-        url = reverse('dashboard-stats')
-        response = member_client.get(url)
+        response = member_client.get(DASHBOARD_STATS_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
@@ -36,38 +44,34 @@ class TestDashboardStats:
 
     def test_get_my_tasks(self, admin_client, ticket_assigned):
         """TC-DASH-002: Get user's assigned tasks"""
-        url = reverse('my-tasks')
-        response = admin_client.get(url)
+        response = admin_client.get(MY_TASKS_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
-        tasks = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        tasks = paginated(response.data)
         # Admin should have at least one assigned ticket
         assert len(tasks) >= 0  # May be 0 if no tickets assigned to current user
 
     def test_team_overview_as_manager(self, manager_client, multiple_tickets):
         """TC-DASH-003: Manager can get team overview"""
-        url = reverse('team-overview')
-        response = manager_client.get(url)
+        response = manager_client.get(TEAM_OVERVIEW_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
     def test_team_overview_as_member_forbidden(self, member_client):
         """Regular member cannot access team overview"""
-        url = reverse('team-overview')
-        response = member_client.get(url)
+        response = member_client.get(TEAM_OVERVIEW_URL)
 
         # May return 403 or empty data depending on implementation
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_403_FORBIDDEN]
 
     def test_get_overdue_tickets(self, manager_client, ticket_with_deadline):
         """TC-DASH-004: Get overdue tickets"""
-        url = reverse('overdue-tickets')
-        response = manager_client.get(url)
+        response = manager_client.get(OVERDUE_TICKETS_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
-        tickets = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        tickets = paginated(response.data)
         # May or may not have overdue tickets
         assert isinstance(tickets, list)
 
@@ -78,8 +82,7 @@ class TestDashboardCharts:
 
     def test_stats_include_chart_data(self, member_client, multiple_tickets):
         """Dashboard stats include data for charts"""
-        url = reverse('dashboard-stats')
-        response = member_client.get(url)
+        response = member_client.get(DASHBOARD_STATS_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
@@ -89,8 +92,7 @@ class TestDashboardCharts:
 
     def test_stats_by_status(self, member_client, multiple_tickets):
         """Dashboard includes ticket counts by status"""
-        url = reverse('dashboard-stats')
-        response = member_client.get(url)
+        response = member_client.get(DASHBOARD_STATS_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
@@ -99,26 +101,70 @@ class TestDashboardCharts:
 
     def test_stats_by_priority(self, member_client, multiple_tickets):
         """Dashboard includes ticket counts by priority"""
-        url = reverse('dashboard-stats')
-        response = member_client.get(url)
+        response = member_client.get(DASHBOARD_STATS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestDashboardWeeklyChart:
+    """Weekly chart buckets"""
+
+    def test_weekly_chart_counts(self, manager_client, member_user):
+        """Tickets are counted on the day they were created / completed"""
+        today = timezone.now()
+        three_days_ago = today - timedelta(days=3)
+        Ticket.objects.create(title='Today', description='d', requester=member_user)
+        older = Ticket.objects.create(title='Older', description='d', requester=member_user,
+                                      status=Ticket.Status.COMPLETED)
+        Ticket.objects.filter(pk=older.pk).update(created_at=three_days_ago)
+
+        response = manager_client.get(DASHBOARD_STATS_URL)
 
         assert response.status_code == status.HTTP_200_OK
+        weekly = {day['date']: day for day in response.data['weekly_chart']}
+        assert len(weekly) == 7
+        assert weekly[today.strftime('%m/%d')]['created'] == 1
+        assert weekly[today.strftime('%m/%d')]['completed'] == 1
+        assert weekly[three_days_ago.strftime('%m/%d')]['created'] == 1
+        assert weekly[three_days_ago.strftime('%m/%d')]['completed'] == 0
 
 
 @pytest.mark.django_db
+class TestDashboardCache:
+    """Cached dashboard stats"""
+
+    def test_members_get_their_own_stats(self, api_client, member_client, member_user,
+                                         creative_user, ticket_requested):
+        """A member's cached dashboard isn't served to another member"""
+        assert member_client.get(DASHBOARD_STATS_URL).data['total_tickets'] == 1
+
+        api_client.force_authenticate(user=creative_user)
+        assert api_client.get(DASHBOARD_STATS_URL).data['total_tickets'] == 0
+
+    def test_ticket_change_refreshes_stats(self, member_client, member_user, ticket_requested):
+        """Saving a ticket invalidates the cached dashboard"""
+        assert member_client.get(DASHBOARD_STATS_URL).data['pending_approval'] == 1
+
+        ticket_requested.status = Ticket.Status.REJECTED
+        ticket_requested.save()
+
+        data = member_client.get(DASHBOARD_STATS_URL).data
+        assert data['pending_approval'] == 0
+        assert data['rejected'] == 1
+
+
 class TestDashboardAccess:
-    """Dashboard Access Control Tests"""
+    """Dashboard Access Control Tests (no database needed)"""
 
     def test_dashboard_unauthenticated(self, api_client):
         """Unauthenticated access to dashboard fails"""
-        url = reverse('dashboard-stats')
-        response = api_client.get(url)
+        response = api_client.get(DASHBOARD_STATS_URL)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_my_tasks_unauthenticated(self, api_client):
         """Unauthenticated access to my tasks fails"""
-        url = reverse('my-tasks')
-        response = api_client.get(url)
+        response = api_client.get(MY_TASKS_URL)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
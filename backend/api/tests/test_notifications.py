@@ -6,6 +6,11 @@ import pytest
 from django.urls import reverse
 from rest_framework import status
 from api.models import Notification
+from api.tests.utils import paginated
+
+NOTIFICATION_LIST_URL = reverse('notification-list')
+NOTIFICATION_READ_ALL_URL = reverse('notification-read-all')
+NOTIFICATION_UNREAD_COUNT_URL = reverse('notification-unread-count')
 
 
 @pytest.mark.django_db
@@ -14,32 +19,27 @@ class TestNotifications:
 
     def test_list_notifications(self, member_client, user_notification):
         """TC-NOTIF-001: List user's notifications"""
-        url = reverse('notification-list')
-        response = member_client.get(url)
+        response = member_client.get(NOTIFICATION_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
-        notifications = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        notifications = paginated(response.data)
         assert len(notifications) >= 1
 
-    def test_list_notifications_only_own(self, member_client, user_notification, admin_user, ticket_requested, member_user):
+    def test_list_notifications_only_own(self, member_client, member_user, admin_user, notification_factory):
         """User only sees their own notifications"""
-        # Create notification for admin
-        admin_notification = Notification.objects.create(
-            user=admin_user,
-            ticket=ticket_requested,
-            message='Admin notification',
-            notification_type='assigned'
-        )
+        notification_factory(member_user)
+        admin_notification = notification_factory(admin_user, message='Admin notification',
+                                                  notification_type='assigned')
+        notification_factory.flush()
 
-        url = reverse('notification-list')
-        response = member_client.get(url)
+        response = member_client.get(NOTIFICATION_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
-        notifications = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        notifications = paginated(response.data)
         # Verify that admin's notification is NOT in the list (user filtering works)
-        notification_ids = [n.get('id') for n in notifications]
+        notification_ids = {n.get('id') for n in notifications}
         assert admin_notification.id not in notification_ids
 
     def test_mark_notification_as_read(self, member_client, user_notification):
@@ -56,63 +56,51 @@ class TestNotifications:
 
     def test_mark_all_notifications_read(self, member_client, multiple_notifications):
         """TC-NOTIF-003: Mark all notifications as read"""
-        url = reverse('notification-read-all')
-        response = member_client.post(url)
+        response = member_client.post(NOTIFICATION_READ_ALL_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
         # Verify all are marked as read
-        for notif in multiple_notifications:
-            notif.refresh_from_db()
-            assert notif.is_read is True
+        ids = [n.id for n in multiple_notifications]
+        assert not Notification.objects.filter(id__in=ids, is_read=False).exists()
 
     def test_get_unread_count(self, member_client, multiple_notifications):
         """TC-NOTIF-004: Get unread notification count"""
-        url = reverse('notification-unread-count')
-        response = member_client.get(url)
+        response = member_client.get(NOTIFICATION_UNREAD_COUNT_URL)
 
         assert response.status_code == status.HTTP_200_OK
         assert 'count' in response.data or 'unread_count' in response.data
 
     def test_notification_includes_ticket_link(self, member_client, user_notification):
         """Notification includes ticket reference"""
-        url = reverse('notification-list')
-        response = member_client.get(url)
+        response = member_client.get(NOTIFICATION_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
-        notifications = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        notifications = paginated(response.data)
         if notifications:
             notif = notifications[0]
             assert 'ticket' in notif or 'ticket_id' in notif
 
     def test_notifications_ordered_by_date(self, member_client, multiple_notifications):
         """Notifications are ordered by creation date (newest first)"""
-        url = reverse('notification-list')
-        response = member_client.get(url)
+        response = member_client.get(NOTIFICATION_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
-        notifications = response.data if isinstance(response.data, list) else response.data.get('results', [])
+        notifications = paginated(response.data)
         if len(notifications) >= 2:
             # Verify ordering (newest first)
             dates = [n.get('created_at', '') for n in notifications]
             assert dates == sorted(dates, reverse=True)
 
 
-@pytest.mark.django_db
 class TestNotificationAccess:
     """Notification Access Control Tests"""
 
-    def test_cannot_read_others_notification(self, member_client, admin_user, ticket_requested):
+    @pytest.mark.django_db
+    def test_cannot_read_others_notification(self, member_client, admin_notification):
         """Cannot mark another user's notification as read"""
-        admin_notification = Notification.objects.create(
-            user=admin_user,
-            ticket=ticket_requested,
-            message='Admin only',
-            notification_type='new_request'
-        )
-
         url = reverse('notification-read', kwargs={'pk': admin_notification.id})
         response = member_client.post(url)
 
@@ -120,7 +108,6 @@ class TestNotificationAccess:
 
     def test_notifications_unauthenticated(self, api_client):
         """Unauthenticated access to notifications fails"""
-        url = reverse('notification-list')
-        response = api_client.get(url)
+        response = api_client.get(NOTIFICATION_LIST_URL)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
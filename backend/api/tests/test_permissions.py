@@ -5,166 +5,161 @@ Tests for role-based access control
 import pytest
 from django.urls import reverse
 from rest_framework import status
+from api.tests.utils import detail_url
+
+USER_MANAGEMENT_LIST_URL = reverse('user-management-list')
+TICKET_LIST_URL = reverse('ticket-list')
+TEAM_OVERVIEW_URL = reverse('team-overview')
+DASHBOARD_STATS_URL = reverse('dashboard-stats')
+
+pytestmark = pytest.mark.django_db
+
+
+class TestRolePermissions:
+    """Role x action permission matrix (approve, assign, user management)"""
+
+    @pytest.mark.parametrize('client_fixture, expected_status', [
+        # Manager can do first approval (REQUESTED → PENDING_CREATIVE)
+        pytest.param('manager_client', status.HTTP_200_OK, id='manager'),
+        pytest.param('member_client', status.HTTP_403_FORBIDDEN, id='member'),
+    ])
+    def test_approve_requested_ticket(self, request, client_fixture, expected_status, ticket_requested):
+        """Only managers can approve a requested ticket"""
+        client = request.getfixturevalue(client_fixture)
+        response = client.post(detail_url('ticket-approve', ticket_requested.id))
+        assert response.status_code == expected_status
+
+    @pytest.mark.parametrize('client_fixture, expected_status', [
+        pytest.param('admin_client', status.HTTP_200_OK, id='admin'),
+        pytest.param('manager_client', status.HTTP_200_OK, id='manager'),
+        pytest.param('member_client', status.HTTP_403_FORBIDDEN, id='member'),
+    ])
+    def test_assign_approved_ticket(self, request, client_fixture, expected_status,
+                                    ticket_approved, creative_user):
+        """Admins and managers can assign tickets to Creative department members"""
+        client = request.getfixturevalue(client_fixture)
+        url = detail_url('ticket-assign', ticket_approved.id)
+        response = client.post(url, {'assigned_to': creative_user.id})
+        assert response.status_code == expected_status
+
+    @pytest.mark.parametrize('client_fixture, expected_status', [
+        pytest.param('admin_client', status.HTTP_200_OK, id='admin'),
+        pytest.param('member_client', status.HTTP_403_FORBIDDEN, id='member'),
+    ])
+    def test_user_management_list(self, request, client_fixture, expected_status):
+        """Admin has full user management access; members have none"""
+        client = request.getfixturevalue(client_fixture)
+        response = client.get(USER_MANAGEMENT_LIST_URL)
+        assert response.status_code == expected_status
 
 
-@pytest.mark.django_db
 class TestAdminPermissions:
     """Admin Role Permission Tests"""
 
-    def test_admin_can_manage_users(self, admin_client, member_user):
-        """Admin has full user management access"""
-        url = reverse('user-management-list')
-        response = admin_client.get(url)
-        assert response.status_code == status.HTTP_200_OK
-
     def test_admin_can_approve_tickets(self, admin_client, ticket_requested):
         """Admin (in Creative dept) can do final approval on pending_creative tickets"""
         # Set ticket to pending_creative status first
         ticket_requested.status = 'pending_creative'
-        ticket_requested.save()
+        ticket_requested.save(update_fields=['status'])
 
-        url = reverse('ticket-approve', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-approve', ticket_requested.id)
         response = admin_client.post(url)
         assert response.status_code == status.HTTP_200_OK
 
-    def test_admin_can_assign_tickets(self, admin_client, ticket_approved, creative_user):
-        """Admin can assign tickets to Creative department members"""
-        url = reverse('ticket-assign', kwargs={'pk': ticket_approved.id})
-        data = {'assigned_to': creative_user.id}
-        response = admin_client.post(url, data, format='json')
-        assert response.status_code == status.HTTP_200_OK
-
     def test_admin_can_change_roles(self, admin_client, member_user):
         """Admin can change user roles"""
-        url = reverse('user-management-change-role', kwargs={'pk': member_user.id})
-        response = admin_client.post(url, {'role': 'manager'}, format='json')
+        url = detail_url('user-management-change-role', member_user.id)
+        response = admin_client.post(url, {'role': 'manager'})
         assert response.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.django_db
 class TestManagerPermissions:
     """Manager Role Permission Tests"""
 
     def test_manager_can_view_all_tickets(self, manager_client, ticket_requested):
         """Manager can view all tickets"""
-        url = reverse('ticket-list')
-        response = manager_client.get(url)
+        response = manager_client.get(TICKET_LIST_URL)
         assert response.status_code == status.HTTP_200_OK
 
-    def test_manager_can_approve_tickets(self, manager_client, ticket_requested):
-        """Manager can do first approval (REQUESTED → PENDING_CREATIVE)"""
-        url = reverse('ticket-approve', kwargs={'pk': ticket_requested.id})
-        response = manager_client.post(url)
-        # First approval should succeed
-        assert response.status_code == status.HTTP_200_OK
-
-    def test_manager_can_assign_tickets(self, manager_client, ticket_approved, creative_user):
-        """Manager can assign tickets to Creative department members"""
-        url = reverse('ticket-assign', kwargs={'pk': ticket_approved.id})
-        data = {'assigned_to': creative_user.id}
-        response = manager_client.post(url, data, format='json')
-        assert response.status_code == status.HTTP_200_OK
+        # Unchanged list revalidates with 304
+        response = manager_client.get(TICKET_LIST_URL, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
 
     def test_manager_can_view_team_overview(self, manager_client):
         """Manager can view team overview"""
-        url = reverse('team-overview')
-        response = manager_client.get(url)
+        response = manager_client.get(TEAM_OVERVIEW_URL)
         assert response.status_code == status.HTTP_200_OK
 
+        response = manager_client.get(TEAM_OVERVIEW_URL, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
 
-@pytest.mark.django_db
 class TestMemberPermissions:
     """Member Role Permission Tests"""
 
     def test_member_can_create_tickets(self, member_client, valid_ticket_data):
         """Member can create tickets"""
-        url = reverse('ticket-list')
-        response = member_client.post(url, valid_ticket_data, format='json')
+        response = member_client.post(TICKET_LIST_URL, valid_ticket_data)
         assert response.status_code == status.HTTP_201_CREATED
 
-    def test_member_cannot_approve_tickets(self, member_client, ticket_requested):
-        """Member cannot approve tickets"""
-        url = reverse('ticket-approve', kwargs={'pk': ticket_requested.id})
-        response = member_client.post(url)
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_member_cannot_assign_tickets(self, member_client, ticket_approved, admin_user):
-        """Member cannot assign tickets"""
-        url = reverse('ticket-assign', kwargs={'pk': ticket_approved.id})
-        data = {'assigned_to': admin_user.id}
-        response = member_client.post(url, data, format='json')
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_member_cannot_manage_users(self, member_client):
-        """Member cannot manage users"""
-        url = reverse('user-management-list')
-        response = member_client.get(url)
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
     def test_member_can_view_own_tickets(self, member_client, ticket_requested):
         """Member can view their own tickets"""
-        url = reverse('ticket-detail', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-detail', ticket_requested.id)
         response = member_client.get(url)
         assert response.status_code == status.HTTP_200_OK
 
     def test_member_can_comment_on_tickets(self, member_client, ticket_requested):
         """Member can comment on tickets"""
-        url = reverse('ticket-comments', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-comments', ticket_requested.id)
         data = {'comment': 'Test comment'}
-        response = member_client.post(url, data, format='json')
+        response = member_client.post(url, data)
         assert response.status_code == status.HTTP_201_CREATED
 
 
-@pytest.mark.django_db
 class TestUnauthenticatedAccess:
     """Unauthenticated Access Tests"""
 
     def test_unauthenticated_cannot_list_tickets(self, api_client):
         """Unauthenticated user cannot list tickets"""
-        url = reverse('ticket-list')
-        response = api_client.get(url)
+        response = api_client.get(TICKET_LIST_URL)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_unauthenticated_cannot_create_ticket(self, api_client, valid_ticket_data):
         """Unauthenticated user cannot create tickets"""
-        url = reverse('ticket-list')
-        response = api_client.post(url, valid_ticket_data, format='json')
+        response = api_client.post(TICKET_LIST_URL, valid_ticket_data)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_unauthenticated_cannot_view_dashboard(self, api_client):
         """Unauthenticated user cannot view dashboard"""
-        url = reverse('dashboard-stats')
-        response = api_client.get(url)
+        response = api_client.get(DASHBOARD_STATS_URL)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_unauthenticated_cannot_view_users(self, api_client):
         """Unauthenticated user cannot view user management"""
-        url = reverse('user-management-list')
-        response = api_client.get(url)
+        response = api_client.get(USER_MANAGEMENT_LIST_URL)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-@pytest.mark.django_db
 class TestTicketOwnership:
     """Ticket Ownership Permission Tests"""
 
     def test_requester_can_confirm_completion(self, member_client, ticket_completed, member_user):
         """Requester can confirm ticket completion"""
         ticket_completed.requester = member_user
-        ticket_completed.save()
+        ticket_completed.save(update_fields=['requester'])
 
-        url = reverse('ticket-confirm', kwargs={'pk': ticket_completed.id})
+        url = detail_url('ticket-confirm', ticket_completed.id)
         response = member_client.post(url)
         assert response.status_code == status.HTTP_200_OK
 
     def test_non_requester_cannot_confirm(self, manager_client, ticket_completed):
         """Non-requester cannot confirm ticket completion"""
-        url = reverse('ticket-confirm', kwargs={'pk': ticket_completed.id})
+        url = detail_url('ticket-confirm', ticket_completed.id)
         response = manager_client.post(url)
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_assigned_user_can_complete_ticket(self, admin_client, ticket_in_progress):
         """Assigned user can complete ticket"""
-        url = reverse('ticket-complete', kwargs={'pk': ticket_in_progress.id})
+        url = detail_url('ticket-complete', ticket_in_progress.id)
         response = admin_client.post(url)
         assert response.status_code == status.HTTP_200_OK
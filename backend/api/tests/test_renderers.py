@@ -0,0 +1,63 @@
+"""
+Renderer Tests
+ORJSONRenderer must produce the same JSON as DRF's JSONRenderer
+"""
+import json
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import ORJSONRenderer
+
+TICKET_LIST_URL = reverse('ticket-list')
+
+
+class TestORJSONRenderer:
+    """ORJSONRenderer output parity"""
+
+    def test_matches_json_renderer(self):
+        """Datetimes, decimals and lazy strings render like DRF's encoder"""
+        data = {
+            'id': 1,
+            'created_at': datetime(2024, 5, 1, 8, 30, tzinfo=dt_timezone.utc),
+            'local_at': datetime(2024, 5, 1, 8, 30, tzinfo=dt_timezone(timedelta(hours=8))),
+            'deadline': date(2024, 5, 2),
+            'estimated_hours': Decimal('2.50'),
+            'label': gettext_lazy('Video'),
+            'items': [{'id': 2, 'name': 'Ünïcode'}],
+            'empty': None,
+        }
+        fast = ORJSONRenderer().render(data)
+        stock = JSONRenderer().render(data)
+
+        assert json.loads(fast) == json.loads(stock)
+
+    def test_none_renders_empty(self):
+        """No data (e.g. 204 responses) renders an empty body"""
+        assert ORJSONRenderer().render(None) == b''
+
+    def test_indent_uses_stock_renderer(self):
+        """Indented output falls back to DRF's JSONRenderer"""
+        data = {'id': 1}
+        rendered = ORJSONRenderer().render(data, 'application/json; indent=2')
+
+        assert rendered == JSONRenderer().render(data, 'application/json; indent=2')
+
+
+@pytest.mark.django_db
+class TestRendererIntegration:
+    """API responses go through ORJSONRenderer"""
+
+    def test_ticket_list_is_json(self, manager_client, ticket_requested):
+        """Ticket list renders as parseable JSON"""
+        response = manager_client.get(TICKET_LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert isinstance(response.accepted_renderer, ORJSONRenderer)
+        body = json.loads(response.content)
+        assert body['results'][0]['id'] == ticket_requested.id
@@ -3,35 +3,32 @@ Ticket Actions Tests (TC-ACTION)
 Tests for ticket workflow actions: approve, reject, assign, start, complete, confirm
 """
 import pytest
-from django.urls import reverse
 from rest_framework import status
-from api.models import Ticket, ActivityLog
+from api.models import Ticket
+from api.tests.utils import detail_url
+
+pytestmark = pytest.mark.django_db
 
 
-@pytest.mark.django_db
 class TestTicketApproval:
     """TC-ACTION-001 to TC-ACTION-003: Ticket Approval/Rejection Tests"""
 
     def test_approve_ticket_as_manager(self, manager_client, ticket_requested):
         """TC-ACTION-001: Manager can do first approval (REQUESTED → PENDING_CREATIVE)"""
-        url = reverse('ticket-approve', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-approve', ticket_requested.id)
         response = manager_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
         # Two-step workflow: first approval moves to pending_creative
         assert response.data['status'] == 'pending_creative'
 
-        # Verify in database
-        ticket_requested.refresh_from_db()
-        assert ticket_requested.status == 'pending_creative'
-
     def test_approve_ticket_as_admin(self, admin_client, ticket_requested):
         """Admin (in Creative dept) can do final approval"""
         # First, set ticket to pending_creative status (simulating first approval)
         ticket_requested.status = 'pending_creative'
-        ticket_requested.save()
+        ticket_requested.save(update_fields=['status'])
 
-        url = reverse('ticket-approve', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-approve', ticket_requested.id)
         response = admin_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -39,23 +36,23 @@ class TestTicketApproval:
 
     def test_approve_ticket_as_member_forbidden(self, member_client, ticket_requested):
         """TC-ACTION-002: Regular member cannot approve ticket"""
-        url = reverse('ticket-approve', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-approve', ticket_requested.id)
         response = member_client.post(url)
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_reject_ticket_with_reason(self, manager_client, ticket_requested):
         """TC-ACTION-003: Manager can reject ticket with reason"""
-        url = reverse('ticket-reject', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-reject', ticket_requested.id)
         data = {'reason': 'Not a valid request'}
-        response = manager_client.post(url, data, format='json')
+        response = manager_client.post(url, data)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['status'] == 'rejected'
 
     def test_reject_ticket_without_reason(self, manager_client, ticket_requested):
         """Manager can reject ticket without reason (optional)"""
-        url = reverse('ticket-reject', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-reject', ticket_requested.id)
         response = manager_client.post(url)
 
         # Should succeed - reason is optional
@@ -63,65 +60,59 @@ class TestTicketApproval:
 
     def test_cannot_approve_already_approved(self, manager_client, ticket_approved):
         """Cannot approve an already approved ticket"""
-        url = reverse('ticket-approve', kwargs={'pk': ticket_approved.id})
+        url = detail_url('ticket-approve', ticket_approved.id)
         response = manager_client.post(url)
 
-        # Should fail or return current state
-        assert response.status_code in [status.HTTP_400_BAD_REQUEST, status.HTTP_200_OK]
+        # Only requested / pending_creative tickets can be approved
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.django_db
 class TestTicketAssignment:
     """TC-ACTION-004 to TC-ACTION-005: Ticket Assignment Tests"""
 
     def test_assign_ticket(self, manager_client, ticket_approved, creative_user):
         """TC-ACTION-004: Manager can assign ticket to Creative department user"""
-        url = reverse('ticket-assign', kwargs={'pk': ticket_approved.id})
+        url = detail_url('ticket-assign', ticket_approved.id)
         data = {'assigned_to': creative_user.id}
-        response = manager_client.post(url, data, format='json')
+        response = manager_client.post(url, data)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['assigned_to']['id'] == creative_user.id
 
-        # Verify in database
-        ticket_approved.refresh_from_db()
-        assert ticket_approved.assigned_to == creative_user
-
     def test_assign_ticket_not_approved(self, manager_client, ticket_requested, creative_user):
         """TC-ACTION-005: Assign ticket that's not approved"""
-        url = reverse('ticket-assign', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-assign', ticket_requested.id)
         data = {'assigned_to': creative_user.id}
-        response = manager_client.post(url, data, format='json')
+        response = manager_client.post(url, data)
 
-        # API may allow assigning unapproved tickets (policy decision)
-        # Test that assignment is handled (200) or rejected (400)
-        assert response.status_code in [status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST]
+        # Assignment is allowed before approval
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['assigned_to']['id'] == creative_user.id
 
     def test_assign_ticket_as_member_forbidden(self, member_client, ticket_approved, creative_user):
         """Regular member cannot assign tickets"""
-        url = reverse('ticket-assign', kwargs={'pk': ticket_approved.id})
+        url = detail_url('ticket-assign', ticket_approved.id)
         data = {'assigned_to': creative_user.id}
-        response = member_client.post(url, data, format='json')
+        response = member_client.post(url, data)
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_reassign_ticket(self, manager_client, ticket_approved, creative_user):
         """Manager can reassign ticket to different Creative department user"""
         # Use ticket_approved instead of ticket_assigned to avoid IN_PROGRESS restriction
-        url = reverse('ticket-assign', kwargs={'pk': ticket_approved.id})
+        url = detail_url('ticket-assign', ticket_approved.id)
         data = {'assigned_to': creative_user.id}
-        response = manager_client.post(url, data, format='json')
+        response = manager_client.post(url, data)
 
         assert response.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.django_db
 class TestTicketWorkflow:
     """TC-ACTION-006 to TC-ACTION-010: Ticket Workflow Tests"""
 
     def test_start_work(self, admin_client, ticket_assigned):
         """TC-ACTION-006: Assigned user can start work"""
-        url = reverse('ticket-start', kwargs={'pk': ticket_assigned.id})
+        url = detail_url('ticket-start', ticket_assigned.id)
         response = admin_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -129,15 +120,15 @@ class TestTicketWorkflow:
 
     def test_start_work_not_assigned_fails(self, member_client, ticket_approved):
         """TC-ACTION-007: Cannot start work on unassigned ticket"""
-        url = reverse('ticket-start', kwargs={'pk': ticket_approved.id})
+        url = detail_url('ticket-start', ticket_approved.id)
         response = member_client.post(url)
 
-        # Should fail or return permission error
-        assert response.status_code in [status.HTTP_400_BAD_REQUEST, status.HTTP_403_FORBIDDEN]
+        # Start is refused until the ticket has an assignee
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_complete_ticket(self, admin_client, ticket_in_progress):
         """TC-ACTION-008: Assigned user can complete ticket"""
-        url = reverse('ticket-complete', kwargs={'pk': ticket_in_progress.id})
+        url = detail_url('ticket-complete', ticket_in_progress.id)
         response = admin_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -147,9 +138,9 @@ class TestTicketWorkflow:
         """TC-ACTION-009: Requester can confirm completion"""
         # Ensure the member is the requester
         ticket_completed.requester = member_user
-        ticket_completed.save()
+        ticket_completed.save(update_fields=['requester'])
 
-        url = reverse('ticket-confirm', kwargs={'pk': ticket_completed.id})
+        url = detail_url('ticket-confirm', ticket_completed.id)
         response = member_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -157,69 +148,67 @@ class TestTicketWorkflow:
 
     def test_confirm_completion_not_requester_fails(self, manager_client, ticket_completed):
         """TC-ACTION-010: Non-requester cannot confirm completion"""
-        url = reverse('ticket-confirm', kwargs={'pk': ticket_completed.id})
+        url = detail_url('ticket-confirm', ticket_completed.id)
         response = manager_client.post(url)
 
         # Should fail - only requester can confirm
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    def test_request_revision_returns_revision_comment(self, member_client, ticket_completed):
+        """Requester can send a completed ticket back; the response shows the new comment"""
+        url = detail_url('ticket-request-revision', ticket_completed.id)
+        response = member_client.post(url, {'revision_comments': 'Logo is too small'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['status'] == 'in_progress'
+        assert response.data['revision_count'] == 1
+        assert [c['comment'] for c in response.data['comments']] == [
+            '[REVISION REQUEST #1] Logo is too small'
+        ]
+
 
-@pytest.mark.django_db
 class TestTicketWorkflowValidation:
     """Ticket Workflow Validation Tests"""
 
     def test_cannot_complete_requested_ticket(self, member_client, ticket_requested):
         """Cannot complete a ticket that's not in progress"""
-        url = reverse('ticket-complete', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-complete', ticket_requested.id)
         response = member_client.post(url)
 
-        assert response.status_code in [status.HTTP_400_BAD_REQUEST, status.HTTP_403_FORBIDDEN]
+        # The requester isn't assigned, so the assignee check refuses it first
+        assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_cannot_confirm_non_completed_ticket(self, member_client, ticket_in_progress, member_user):
         """Cannot confirm a ticket that's not completed"""
         ticket_in_progress.requester = member_user
-        ticket_in_progress.save()
+        ticket_in_progress.save(update_fields=['requester'])
 
-        url = reverse('ticket-confirm', kwargs={'pk': ticket_in_progress.id})
+        url = detail_url('ticket-confirm', ticket_in_progress.id)
         response = member_client.post(url)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.django_db
 class TestActivityLogging:
     """Test that actions create activity logs"""
 
-    def test_approve_creates_activity_log(self, manager_client, ticket_requested):
+    def test_approve_creates_activity_log(self, manager_client, ticket_requested, activity_log_capture):
         """Approving ticket creates activity log"""
-        initial_count = ActivityLog.objects.count()
-
-        url = reverse('ticket-approve', kwargs={'pk': ticket_requested.id})
+        url = detail_url('ticket-approve', ticket_requested.id)
         response = manager_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
 
-        # Check activity log was created
-        new_count = ActivityLog.objects.count()
-        assert new_count > initial_count
-
-        # Verify activity details - first approval is 'pending_approval' or similar action
-        # Check for any approval-related activity
-        activity = ActivityLog.objects.filter(
-            ticket=ticket_requested
-        ).order_by('-created_at').first()
-        assert activity is not None
+        assert any(log.ticket_id == ticket_requested.id for log in activity_log_capture)
 
-    def test_assign_creates_activity_log(self, manager_client, ticket_approved, creative_user):
+    def test_assign_creates_activity_log(self, manager_client, ticket_approved, creative_user,
+                                         activity_log_capture):
         """Assigning ticket creates activity log"""
-        url = reverse('ticket-assign', kwargs={'pk': ticket_approved.id})
+        url = detail_url('ticket-assign', ticket_approved.id)
         data = {'assigned_to': creative_user.id}
-        response = manager_client.post(url, data, format='json')
+        response = manager_client.post(url, data)
 
         assert response.status_code == status.HTTP_200_OK
 
-        activity = ActivityLog.objects.filter(
-            ticket=ticket_approved,
-            action='assigned'
-        ).first()
-        assert activity is not None
+        assert any(log.ticket_id == ticket_approved.id and log.action == 'assigned'
+                   for log in activity_log_capture)
@@ -7,19 +7,28 @@ from django.urls import reverse
 from rest_framework import status
 from django.contrib.auth import get_user_model
 
+pytestmark = pytest.mark.django_db
+
 User = get_user_model()
 
+USER_MANAGEMENT_LIST_URL = reverse('user-management-list')
+USER_LIST_URL = reverse('user-list')
+
 
-@pytest.mark.django_db
 class TestUserListing:
     """TC-USER-001 to TC-USER-002: User Listing Tests"""
 
-    def test_list_users_as_admin(self, admin_client, member_user, manager_user):
+    def test_list_users_as_admin(self, admin_client, member_user, manager_user,
+                                 django_assert_num_queries):
         """TC-USER-001: Admin can list all users"""
-        url = reverse('user-management-list')
-        response = admin_client.get(url)
+        # Department and approver name come from the list query itself,
+        # so the count does not grow with the number of users
+        with django_assert_num_queries(1) as captured:
+            response = admin_client.get(USER_MANAGEMENT_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
+        # Only the serialized columns are read; password hashes stay in the DB
+        assert '"password"' not in captured.captured_queries[0]['sql']
         # Should return paginated results or list
         if 'results' in response.data:
             users = response.data['results']
@@ -27,45 +36,75 @@ class TestUserListing:
             users = response.data
         assert len(users) >= 2  # At least member and manager
 
+    @pytest.mark.parametrize('url', [USER_MANAGEMENT_LIST_URL, USER_LIST_URL], ids=['manage', 'assignable'])
+    def test_list_queries_do_not_scale(self, admin_client, admin_user, department,
+                                       django_assert_num_queries, url):
+        """Extra users with departments and approvers add no queries"""
+        User.objects.bulk_create([
+            User(username=f'extra{i}', user_department=department, is_approved=True,
+                 approved_by=admin_user)
+            for i in range(5)
+        ])
+        with django_assert_num_queries(1):
+            response = admin_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {f'extra{i}' for i in range(5)} <= {user['username'] for user in response.data}
+
     def test_list_users_as_manager(self, manager_client, member_user):
         """Manager can list users"""
-        url = reverse('user-management-list')
-        response = manager_client.get(url)
+        response = manager_client.get(USER_MANAGEMENT_LIST_URL)
 
         # Managers should have access
         assert response.status_code == status.HTTP_200_OK
 
     def test_list_users_as_member_forbidden(self, member_client):
         """TC-USER-002: Regular member cannot list all users"""
-        url = reverse('user-management-list')
-        response = member_client.get(url)
+        response = member_client.get(USER_MANAGEMENT_LIST_URL)
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_list_users_unauthenticated(self, api_client):
         """Unauthenticated access to user list fails"""
-        url = reverse('user-management-list')
-        response = api_client.get(url)
+        response = api_client.get(USER_MANAGEMENT_LIST_URL)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-@pytest.mark.django_db
 class TestUserApproval:
     """TC-USER-003 to TC-USER-004: User Approval Tests"""
 
-    def test_approve_user(self, admin_client, unapproved_user):
+    def test_approve_user(self, admin_client, admin_user, unapproved_user, django_assert_num_queries):
         """TC-USER-003: Admin can approve a pending user"""
         url = reverse('user-management-approve', kwargs={'pk': unapproved_user.id})
-        response = admin_client.post(url)
+        # Lookup and save only; the response is serialized from loaded data
+        with django_assert_num_queries(2):
+            response = admin_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
+        assert response.data['approved_by'] == admin_user.id
+        assert response.data['approved_by_name'] == admin_user.username
 
         # Verify user is now approved
         unapproved_user.refresh_from_db()
         assert unapproved_user.is_approved is True
         assert unapproved_user.approved_by is not None
 
+    def test_approve_user_queues_telegram(self, admin_client, unapproved_user, mocker,
+                                          django_capture_on_commit_callbacks):
+        """Approval message is handed to the background sender after commit"""
+        unapproved_user.telegram_id = '12345'
+        unapproved_user.save(update_fields=['telegram_id'])
+        submit = mocker.patch('notifications.telegram._send_executor.submit')
+
+        url = reverse('user-management-approve', kwargs={'pk': unapproved_user.id})
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.post(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        submit.assert_called_once()
+        assert submit.call_args.args[1] == '12345'
+
     def test_approve_user_as_manager(self, manager_client, unapproved_user):
         """Manager can approve users"""
         url = reverse('user-management-approve', kwargs={'pk': unapproved_user.id})
@@ -93,14 +132,14 @@ class TestUserApproval:
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
-@pytest.mark.django_db
 class TestUserRoleManagement:
     """TC-USER-005 to TC-USER-006: Role Management Tests"""
 
-    def test_change_user_role(self, admin_client, member_user):
+    def test_change_user_role(self, admin_client, member_user, django_assert_num_queries):
         """TC-USER-005: Admin can change user role"""
         url = reverse('user-management-change-role', kwargs={'pk': member_user.id})
-        response = admin_client.post(url, {'role': 'manager'}, format='json')
+        with django_assert_num_queries(2):
+            response = admin_client.post(url, {'role': 'manager'})
 
         assert response.status_code == status.HTTP_200_OK
 
@@ -111,7 +150,7 @@ class TestUserRoleManagement:
     def test_change_role_to_admin(self, admin_client, member_user):
         """Admin can promote user to admin"""
         url = reverse('user-management-change-role', kwargs={'pk': member_user.id})
-        response = admin_client.post(url, {'role': 'admin'}, format='json')
+        response = admin_client.post(url, {'role': 'admin'})
 
         assert response.status_code == status.HTTP_200_OK
         member_user.refresh_from_db()
@@ -128,21 +167,26 @@ class TestUserRoleManagement:
         inactive_user.refresh_from_db()
         assert inactive_user.is_active is True
 
+    def test_change_role_invalid(self, admin_client, member_user):
+        """Unknown or non-string roles are rejected"""
+        url = reverse('user-management-change-role', kwargs={'pk': member_user.id})
+        for role in ('superuser', ['admin']):
+            response = admin_client.post(url, {'role': role})
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_change_role_as_member_forbidden(self, member_client, manager_user):
         """Regular member cannot change roles"""
         url = reverse('user-management-change-role', kwargs={'pk': manager_user.id})
-        response = member_client.post(url, {'role': 'admin'}, format='json')
+        response = member_client.post(url, {'role': 'admin'})
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
-@pytest.mark.django_db
 class TestUserCreation:
     """TC-USER-007: Admin User Creation Tests"""
 
     def test_admin_create_user(self, admin_client, department):
         """TC-USER-007: Admin can create a new user (auto-approved)"""
-        url = reverse('user-management-list')
         data = {
             'username': 'newcreated',
             'email': 'newcreated@test.com',
@@ -153,7 +197,7 @@ class TestUserCreation:
             'role': 'member',
             'user_department': department.id
         }
-        response = admin_client.post(url, data, format='json')
+        response = admin_client.post(USER_MANAGEMENT_LIST_URL, data)
 
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['username'] == 'newcreated'
@@ -161,9 +205,31 @@ class TestUserCreation:
         if 'is_approved' in response.data:
             assert response.data['is_approved'] is True  # Auto-approved when admin creates
 
+    def test_admin_create_user_single_write(self, admin_client, admin_user, department,
+                                            django_assert_max_num_queries):
+        """Approval and role are saved with the INSERT, no follow-up UPDATE"""
+        data = {
+            'username': 'newmanager',
+            'password': 'NewManager123!',
+            'password_confirm': 'NewManager123!',
+            'role': 'manager',
+            'user_department': department.id
+        }
+        with django_assert_max_num_queries(10) as captured:
+            response = admin_client.post(USER_MANAGEMENT_LIST_URL, data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        writes = [q['sql'] for q in captured.captured_queries
+                  if q['sql'].startswith(('INSERT', 'UPDATE'))]
+        assert len(writes) == 1 and writes[0].startswith('INSERT')
+
+        user = User.objects.get(username='newmanager')
+        assert user.role == 'manager'
+        assert user.is_approved is True
+        assert user.approved_by_id == admin_user.id
+
     def test_member_cannot_create_user(self, member_client):
         """Regular member cannot create users"""
-        url = reverse('user-management-list')
         data = {
             'username': 'unauthorized',
             'email': 'unauthorized@test.com',
@@ -171,21 +237,19 @@ class TestUserCreation:
             'first_name': 'Test',
             'last_name': 'User'
         }
-        response = member_client.post(url, data, format='json')
+        response = member_client.post(USER_MANAGEMENT_LIST_URL, data)
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
-@pytest.mark.django_db
 class TestUserFiltering:
     """TC-USER-008 to TC-USER-009: User Filtering Tests"""
 
     def test_filter_by_approval_status(self, admin_client, member_user, unapproved_user):
         """TC-USER-008: Filter users by approval status"""
-        url = reverse('user-management-list')
 
         # Filter for unapproved users
-        response = admin_client.get(url, {'is_approved': 'false'})
+        response = admin_client.get(USER_MANAGEMENT_LIST_URL, {'is_approved': 'false'})
         assert response.status_code == status.HTTP_200_OK
 
         if 'results' in response.data:
@@ -199,10 +263,9 @@ class TestUserFiltering:
 
     def test_filter_by_role(self, admin_client, member_user, manager_user):
         """TC-USER-009: Filter users by role"""
-        url = reverse('user-management-list')
 
         # Filter for managers
-        response = admin_client.get(url, {'role': 'manager'})
+        response = admin_client.get(USER_MANAGEMENT_LIST_URL, {'role': 'manager'})
         assert response.status_code == status.HTTP_200_OK
 
         if 'results' in response.data:
@@ -214,15 +277,32 @@ class TestUserFiltering:
         for user in users:
             assert user['role'] == 'manager'
 
+    def test_filter_by_approval_status_ignores_invalid_value(self, admin_client, member_user,
+                                                             unapproved_user):
+        """Unrecognized is_approved values don't filter the list"""
+        response = admin_client.get(USER_MANAGEMENT_LIST_URL, {'is_approved': 'maybe'})
+        assert response.status_code == status.HTTP_200_OK
+
+        usernames = {user['username'] for user in response.data}
+        assert {member_user.username, unapproved_user.username} <= usernames
+
+    def test_filter_by_unknown_role(self, admin_client, member_user, django_assert_num_queries):
+        """Unknown role returns an empty list without querying"""
+        with django_assert_num_queries(0):
+            response = admin_client.get(USER_MANAGEMENT_LIST_URL, {'role': 'superuser'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == []
+
 
-@pytest.mark.django_db
 class TestApprovedUsersList:
     """Tests for listing approved active users (for assignment dropdowns)"""
 
-    def test_list_approved_users(self, member_client, member_user, manager_user, admin_user):
+    def test_list_approved_users(self, member_client, member_user, manager_user, admin_user,
+                                 django_assert_num_queries):
         """Get list of approved active users for assignment"""
-        url = reverse('user-list')
-        response = member_client.get(url)
+        with django_assert_num_queries(1):
+            response = member_client.get(USER_LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
 
@@ -234,3 +314,53 @@ class TestApprovedUsersList:
         # All users should be approved and active
         for user in users:
             assert user.get('is_approved', True) is True
+
+    def test_list_approved_users_paginated(self, member_client, member_user, manager_user):
+        """?limit= pages the list; the rows stay in id order"""
+        response = member_client.get(USER_LIST_URL, {'limit': 1, 'offset': 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] >= 2
+        assert len(response.data['results']) == 1
+
+        all_users = member_client.get(USER_LIST_URL).data
+        assert response.data['results'] == all_users[1:2]
+
+    def test_list_approved_users_not_modified(self, member_client, member_user,
+                                              django_assert_num_queries):
+        """Revalidating with the ETag gets a 304 without touching the database"""
+        response = member_client.get(USER_LIST_URL)
+        etag = response['ETag']
+
+        with django_assert_num_queries(0):
+            response = member_client.get(USER_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+
+    def test_list_approved_users_refreshed_on_approval(self, admin_client, unapproved_user):
+        """Approving a user changes the ETag and adds them to the cached list"""
+        response = admin_client.get(USER_LIST_URL)
+        etag = response['ETag']
+        assert unapproved_user.id not in {user['id'] for user in response.data}
+
+        admin_client.post(reverse('user-management-approve', kwargs={'pk': unapproved_user.id}))
+
+        response = admin_client.get(USER_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+        assert unapproved_user.id in {user['id'] for user in response.data}
+
+    def test_list_approved_users_refreshed_on_department_rename(self, member_client, member_user,
+                                                                 department):
+        """Department names are part of each row; renaming one outside the API still refreshes the list"""
+        response = member_client.get(USER_LIST_URL)
+        etag = response['ETag']
+
+        department.name = 'Renamed Department'
+        department.save()
+
+        response = member_client.get(USER_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        names = {user['id']: user['user_department_info']['name'] for user in response.data}
+        assert names[member_user.id] == 'Renamed Department'
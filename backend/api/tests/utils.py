@@ -0,0 +1,17 @@
+"""
+Shared helpers for the API tests
+"""
+from functools import lru_cache
+
+from django.urls import reverse
+
+
+def paginated(data):
+    """Return the result rows from a list response, paginated or not"""
+    return data if isinstance(data, list) else data.get('results', [])
+
+
+@lru_cache(maxsize=None)
+def detail_url(view_name, pk):
+    """reverse() a pk-based route, memoized per (view_name, pk)"""
+    return reverse(view_name, kwargs={'pk': pk})
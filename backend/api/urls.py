@@ -1,6 +1,6 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework.routers import SimpleRouter
+from rest_framework_simplejwt.views import TokenRefreshView
 
 from .views import (
     RegisterView, MeView, UserListView, CustomTokenObtainPairView,
@@ -14,7 +14,9 @@ from .views import (
     TriggerDailyReportView
 )
 
-router = DefaultRouter()
+# SimpleRouter: no browsable API root or .json format-suffix variants, which
+# the frontend never uses and which doubled the patterns scanned per request
+router = SimpleRouter()
 router.register(r'tickets', TicketViewSet, basename='ticket')
 router.register(r'notifications', NotificationViewSet, basename='notification')
 router.register(r'users/manage', UserManagementViewSet, basename='user-management')
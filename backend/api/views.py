@@ -3,13 +3,16 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.views import APIView
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import PageNumberPagination, LimitOffsetPagination
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Count, Case, When, IntegerField, Value
+from django.db.models import Q, F, Count
+from django.db.models.functions import TruncDate
 from django.core.cache import cache
-from django.views.decorators.cache import cache_page
+from django.views.decorators.cache import cache_page, cache_control
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags
 from django.utils.decorators import method_decorator
-from datetime import timedelta
+from datetime import timedelta, timezone as dt_timezone
 from django.utils import timezone
 from django.conf import settings
 import logging
@@ -41,19 +44,63 @@ class TicketPagination(PageNumberPagination):
         })
 
 
+class OptionalLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination that only applies when ?limit= is given.
+    Without it the full list is returned, as the dropdowns expect.
+    """
+    default_limit = None
+    max_limit = 100
+
+
 from .serializers import (
     UserSerializer, UserCreateSerializer, UserMinimalSerializer, UserManagementSerializer,
     TicketListSerializer, TicketDetailSerializer, TicketCreateSerializer,
     TicketUpdateSerializer, TicketAssignSerializer, TicketRejectSerializer,
-    TicketCommentSerializer, TicketAttachmentSerializer, TicketCollaboratorSerializer,
+    TicketCommentSerializer, ReplyCommentSerializer, TicketAttachmentSerializer, TicketCollaboratorSerializer,
     NotificationSerializer, DashboardStatsSerializer, ActivityLogSerializer,
     DepartmentSerializer, ProductSerializer, ChangePasswordSerializer, UpdateUserProfileSerializer,
-    RevisionRequestSerializer
+    RevisionRequestSerializer, DynamicFieldsMixin, requested_fields, included_fields,
+    comment_thread_queryset
 )
 
 
-def log_activity(user, ticket, action, details=''):
-    """Helper function to log activity with ticket state snapshot for rollback"""
+class EagerLoadingViewMixin:
+    """
+    Run the queryset through the serializer's setup_eager_loading() before
+    list/retrieve, so get_queryset() only has to hold the view's filters.
+    Serializers that honour ?fields= only load the relations still rendered,
+    and ones with INCLUDABLE_FIELDS only the opt-in lists named in ?include=.
+    GET requests also narrow the SELECT to the serializer's only_fields;
+    write actions load full rows since they save them and send notifications.
+
+    Viewsets only eager-load for the actions in eager_loading_actions, the ones
+    that answer with the serializer rendered from the fetched instance. Other
+    actions (deletes, workflow transitions) would pay for prefetches they never
+    read, or render ones made stale by the rows they write.
+    """
+    eager_loading_actions = ('list', 'retrieve', 'update', 'partial_update')
+
+    def filter_queryset(self, queryset):
+        serializer_class = self.get_serializer_class()
+        action = getattr(self, 'action', None)
+        if action is not None and action not in self.eager_loading_actions:
+            return super().filter_queryset(queryset)
+        if hasattr(serializer_class, 'setup_eager_loading'):
+            fields = None
+            if issubclass(serializer_class, DynamicFieldsMixin):
+                fields = requested_fields(self.request)
+            kwargs = {}
+            if hasattr(serializer_class, 'INCLUDABLE_FIELDS'):
+                kwargs['include'] = included_fields(self.request)
+            queryset = serializer_class.setup_eager_loading(queryset, fields, **kwargs)
+            if self.request.method == 'GET' and serializer_class.only_fields:
+                queryset = queryset.only(*serializer_class.only_fields)
+        return super().filter_queryset(queryset)
+
+
+def build_activity_log(user, ticket, action, details=''):
+    """Unsaved ActivityLog with the ticket's current state snapshot, for bulk_create"""
     # Capture ticket state snapshot
     snapshot = {
         'status': ticket.status,
@@ -72,7 +119,7 @@ def log_activity(user, ticket, action, details=''):
         'file_format': ticket.file_format,
         'revision_count': ticket.revision_count,
     }
-    ActivityLog.objects.create(
+    return ActivityLog(
         user=user,
         ticket=ticket,
         action=action,
@@ -81,6 +128,11 @@ def log_activity(user, ticket, action, details=''):
     )
 
 
+def log_activity(user, ticket, action, details=''):
+    """Helper function to log activity with ticket state snapshot for rollback"""
+    build_activity_log(user, ticket, action, details).save()
+
+
 def calculate_deadline_from_priority(priority, file_format=None, criteria=None):
     """
     Calculate deadline based on priority and media type (video vs image/still).
@@ -140,10 +192,21 @@ def format_notification_message(ticket, action, extra_info=None):
 
 
 from .permissions import IsAdminUser, IsManagerUser, IsTicketOwnerOrManager, CanApproveTicket
-from .cache_utils import invalidate_ticket_caches
+from .cache_utils import (
+    invalidate_ticket_caches, get_approved_users_version,
+    get_cache_key, CACHE_TTL_USERS
+)
 
 User = get_user_model()
 
+# Accepted values for role parameters (create, change_role, ?role= filter)
+VALID_ROLES = frozenset(User.Role.values)
+
+
+def is_valid_role(value):
+    """Set lookup for role values; JSON bodies may carry unhashable lists/dicts"""
+    return isinstance(value, str) and value in VALID_ROLES
+
 
 # =====================
 # AUTH VIEWS
@@ -188,7 +251,6 @@ class CustomTokenObtainPairView(APIView):
 
     def post(self, request):
         from rest_framework_simplejwt.tokens import RefreshToken
-        from django.contrib.auth import authenticate
         from datetime import timedelta
 
         username = request.data.get('username')
@@ -200,69 +262,59 @@ class CustomTokenObtainPairView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Check if user exists and is locked
+        # One lookup serves the lockout check, the password check and the
+        # failed-attempt tracking (authenticate() would fetch the user again)
         try:
-            user_check = User.objects.get(username=username)
-
-            # Check if account is locked
-            if user_check.is_locked:
-                # Check if lockout period has passed
-                if user_check.locked_at:
-                    unlock_time = user_check.locked_at + timedelta(minutes=self.LOCKOUT_DURATION_MINUTES)
-                    if timezone.now() >= unlock_time:
-                        # Unlock account
-                        user_check.is_locked = False
-                        user_check.locked_at = None
-                        user_check.failed_login_attempts = 0
-                        user_check.save()
-                    else:
-                        minutes_left = int((unlock_time - timezone.now()).total_seconds() / 60)
-                        self.log_attempt(username, False, 'Account locked', request)
-                        return Response(
-                            {'detail': f'Account is locked due to multiple failed login attempts. Try again in {minutes_left + 1} minutes, or contact admin to unlock.'},
-                            status=status.HTTP_423_LOCKED
-                        )
+            user = User.objects.get(username=username)
         except User.DoesNotExist:
-            pass
-
-        user = authenticate(username=username, password=password)
+            # Run the hasher anyway so response time doesn't reveal unknown usernames
+            User().set_password(password)
+            self.log_attempt(username, False, 'User not found', request)
+            return Response(
+                {'detail': 'Invalid credentials'},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
 
-        if user is None:
-            # Track failed attempt
-            try:
-                user_obj = User.objects.get(username=username)
-                user_obj.failed_login_attempts += 1
-                user_obj.last_failed_login = timezone.now()
-
-                if user_obj.failed_login_attempts >= self.MAX_LOGIN_ATTEMPTS:
-                    user_obj.is_locked = True
-                    user_obj.locked_at = timezone.now()
-                    user_obj.save()
-                    self.log_attempt(username, False, 'Account locked after max attempts', request)
+        # Check if account is locked
+        if user.is_locked:
+            # Check if lockout period has passed
+            if user.locked_at:
+                unlock_time = user.locked_at + timedelta(minutes=self.LOCKOUT_DURATION_MINUTES)
+                if timezone.now() >= unlock_time:
+                    # Unlock account
+                    user.is_locked = False
+                    user.locked_at = None
+                    user.failed_login_attempts = 0
+                    user.save(update_fields=['is_locked', 'locked_at', 'failed_login_attempts'])
+                else:
+                    minutes_left = int((unlock_time - timezone.now()).total_seconds() / 60)
+                    self.log_attempt(username, False, 'Account locked', request)
                     return Response(
-                        {'detail': f'Account locked due to {self.MAX_LOGIN_ATTEMPTS} failed login attempts. Contact admin to unlock or wait {self.LOCKOUT_DURATION_MINUTES} minutes.'},
+                        {'detail': f'Account is locked due to multiple failed login attempts. Try again in {minutes_left + 1} minutes, or contact admin to unlock.'},
                         status=status.HTTP_423_LOCKED
                     )
 
-                user_obj.save()
-                remaining = self.MAX_LOGIN_ATTEMPTS - user_obj.failed_login_attempts
-                self.log_attempt(username, False, 'Invalid password', request)
+        # Same rule as ModelBackend: inactive users can't authenticate
+        if not (user.check_password(password) and user.is_active):
+            # Track failed attempt
+            user.failed_login_attempts += 1
+            user.last_failed_login = timezone.now()
+
+            if user.failed_login_attempts >= self.MAX_LOGIN_ATTEMPTS:
+                user.is_locked = True
+                user.locked_at = timezone.now()
+                user.save(update_fields=['failed_login_attempts', 'last_failed_login', 'is_locked', 'locked_at'])
+                self.log_attempt(username, False, 'Account locked after max attempts', request)
                 return Response(
-                    {'detail': f'Invalid credentials. {remaining} attempt(s) remaining before account lockout.'},
-                    status=status.HTTP_401_UNAUTHORIZED
+                    {'detail': f'Account locked due to {self.MAX_LOGIN_ATTEMPTS} failed login attempts. Contact admin to unlock or wait {self.LOCKOUT_DURATION_MINUTES} minutes.'},
+                    status=status.HTTP_423_LOCKED
                 )
-            except User.DoesNotExist:
-                self.log_attempt(username, False, 'User not found', request)
-
-            return Response(
-                {'detail': 'Invalid credentials'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
 
-        if not user.is_active:
-            self.log_attempt(username, False, 'Account deactivated', request)
+            user.save(update_fields=['failed_login_attempts', 'last_failed_login'])
+            remaining = self.MAX_LOGIN_ATTEMPTS - user.failed_login_attempts
+            self.log_attempt(username, False, 'Invalid password', request)
             return Response(
-                {'detail': 'Account is deactivated. Contact administrator.'},
+                {'detail': f'Invalid credentials. {remaining} attempt(s) remaining before account lockout.'},
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
@@ -274,9 +326,10 @@ class CustomTokenObtainPairView(APIView):
             )
 
         # Reset failed attempts on successful login
-        user.failed_login_attempts = 0
-        user.last_failed_login = None
-        user.save()
+        if user.failed_login_attempts or user.last_failed_login:
+            user.failed_login_attempts = 0
+            user.last_failed_login = None
+            user.save(update_fields=['failed_login_attempts', 'last_failed_login'])
 
         self.log_attempt(username, True, '', request)
 
@@ -298,74 +351,106 @@ class MeView(generics.RetrieveUpdateAPIView):
         return self.request.user
 
 
-class UserListView(generics.ListAPIView):
+class UserListView(EagerLoadingViewMixin, generics.ListAPIView):
     """List all users (for assignment dropdown)"""
     serializer_class = UserMinimalSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = None  # Return all as list for dropdowns
+    pagination_class = OptionalLimitOffsetPagination  # Plain list unless ?limit= is given
+
+    @method_decorator(cache_control(private=True, max_age=60))
+    def list(self, request, *args, **kwargs):
+        # The list only changes through user/department edits, which bump the
+        # version; it doubles as the ETag so revalidation skips the query
+        version = get_approved_users_version()
+        etag = f'W/"users-{version}"'
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = HttpResponseNotModified()
+        elif self.paginator.limit_query_param in request.query_params:
+            response = super().list(request, *args, **kwargs)
+        else:
+            cache_key = get_cache_key('users', 'approved', f'v{version}')
+            data = cache.get(cache_key)
+            if data is None:
+                data = super().list(request, *args, **kwargs).data
+                cache.set(cache_key, data, CACHE_TTL_USERS)
+            response = Response(data)
+        response['ETag'] = etag
+        return response
 
     def get_queryset(self):
         # Only return approved and active users for assignment
-        return User.objects.filter(is_active=True, is_approved=True)
+        return User.objects.filter(is_active=True, is_approved=True).order_by('id')
 
 
 # =====================
 # USER MANAGEMENT VIEWS
 # =====================
 
-class UserManagementViewSet(viewsets.ModelViewSet):
+class UserManagementViewSet(EagerLoadingViewMixin, viewsets.ModelViewSet):
     """Admin user management - list, approve, change roles"""
     pagination_class = None  # Show all users without pagination
     serializer_class = UserSerializer
     permission_classes = [IsManagerUser]
 
+    # Every action that answers with the fetched user renders UserSerializer
+    eager_loading_actions = EagerLoadingViewMixin.eager_loading_actions + (
+        'approve', 'reject_user', 'change_role', 'reactivate', 'reset_password',
+        'update_profile', 'unlock_account',
+    )
+
     def get_serializer_class(self):
         if self.action == 'create':
             return UserCreateSerializer
         return UserSerializer
 
+    # Permissions hold no state, so one instance serves every create request
+    _admin_permissions = (IsAdminUser(),)
+
     def get_permissions(self):
         if self.action == 'create':
-            return [IsAdminUser()]
+            return self._admin_permissions
+        # permission_classes, or an @action's own permission_classes
         return super().get_permissions()
 
     def create(self, request, *args, **kwargs):
         """Create a new user (admin only) - auto-approved"""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
-
-        # Auto-approve users created by admin
-        user.is_approved = True
-        user.approved_by = request.user
-        user.approved_at = timezone.now()
 
         # Set role if provided
         role = request.data.get('role', 'member')
-        if role in [User.Role.ADMIN, User.Role.MANAGER, User.Role.MEMBER]:
-            user.role = role
-
-        user.save()
+        if not is_valid_role(role):
+            role = User.Role.MEMBER
+
+        # Auto-approve users created by admin; passed to save() so the
+        # approval and role go out with the INSERT
+        user = serializer.save(
+            is_approved=True,
+            approved_by=request.user,
+            approved_at=timezone.now(),
+            role=role,
+        )
 
         return Response(UserSerializer(user).data, status=status.HTTP_201_CREATED)
 
     def get_queryset(self):
-        # Optimize with select_related for department
-        queryset = User.objects.select_related('user_department').order_by('-date_joined')
+        queryset = User.objects.order_by('-date_joined')
 
-        # Filter by approval status
-        approval_filter = self.request.query_params.get('is_approved')
-        if approval_filter is not None:
-            queryset = queryset.filter(is_approved=approval_filter.lower() == 'true')
+        # Filter by approval status (values other than true/false are ignored)
+        approval_filter = self.request.query_params.get('is_approved', '').lower()
+        if approval_filter in ('true', 'false'):
+            queryset = queryset.filter(is_approved=approval_filter == 'true')
 
-        # Filter by role
+        # Filter by role; an unknown role can't match anyone, so skip the query
         role_filter = self.request.query_params.get('role')
         if role_filter:
+            if not is_valid_role(role_filter):
+                return queryset.none()
             queryset = queryset.filter(role=role_filter)
 
         return queryset
 
-    @action(detail=True, methods=['post'], permission_classes=[IsManagerUser])
+    @action(detail=True, methods=['post'])
     def approve(self, request, pk=None):
         """Approve a user registration"""
         user = self.get_object()
@@ -379,24 +464,25 @@ class UserManagementViewSet(viewsets.ModelViewSet):
         user.is_approved = True
         user.approved_by = request.user
         user.approved_at = timezone.now()
-        user.save()
+        user.save(update_fields=['is_approved', 'approved_by', 'approved_at'])
 
-        # Send Telegram notification if user has telegram_id
+        # Send Telegram notification if user has telegram_id (in the background,
+        # once the approval is committed)
         if user.telegram_id:
-            from notifications.telegram import send_telegram_message
-            send_telegram_message(
+            from notifications.telegram import send_telegram_message_on_commit
+            send_telegram_message_on_commit(
                 user.telegram_id,
                 f"🎉 Your account has been approved! You can now login to Juan365 Ticketing System."
             )
 
         return Response(UserSerializer(user).data)
 
-    @action(detail=True, methods=['post'], permission_classes=[IsManagerUser])
+    @action(detail=True, methods=['post'])
     def reject_user(self, request, pk=None):
         """Reject/deactivate a user"""
         user = self.get_object()
 
-        if user == request.user:
+        if user.pk == request.user.pk:
             return Response(
                 {'error': 'Cannot deactivate yourself'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -404,42 +490,42 @@ class UserManagementViewSet(viewsets.ModelViewSet):
 
         user.is_active = False
         user.is_approved = False
-        user.save()
+        user.save(update_fields=['is_active', 'is_approved'])
 
         return Response(UserSerializer(user).data)
 
-    @action(detail=True, methods=['post'], permission_classes=[IsManagerUser])
+    @action(detail=True, methods=['post'])
     def change_role(self, request, pk=None):
         """Change user role"""
         user = self.get_object()
         new_role = request.data.get('role')
 
-        if new_role not in [User.Role.ADMIN, User.Role.MANAGER, User.Role.MEMBER]:
+        if not is_valid_role(new_role):
             return Response(
                 {'error': 'Invalid role. Must be admin, manager, or member'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        if user == request.user and new_role != User.Role.ADMIN:
+        if user.pk == request.user.pk and new_role != User.Role.ADMIN:
             return Response(
                 {'error': 'Cannot demote yourself'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
         user.role = new_role
-        user.save()
+        user.save(update_fields=['role'])
 
         return Response(UserSerializer(user).data)
 
-    @action(detail=True, methods=['post'], permission_classes=[IsManagerUser])
+    @action(detail=True, methods=['post'])
     def reactivate(self, request, pk=None):
         """Reactivate a deactivated user"""
         user = self.get_object()
         user.is_active = True
-        user.save()
+        user.save(update_fields=['is_active'])
         return Response(UserSerializer(user).data)
 
-    @action(detail=True, methods=['post'], permission_classes=[IsManagerUser])
+    @action(detail=True, methods=['post'])
     def reset_password(self, request, pk=None):
         """Reset user password (admin only)"""
         user = self.get_object()
@@ -458,14 +544,14 @@ class UserManagementViewSet(viewsets.ModelViewSet):
             )
 
         user.set_password(new_password)
-        user.save()
+        user.save(update_fields=['password'])
 
         return Response({
             'message': f'Password reset successfully for {user.username}',
             'user': UserSerializer(user).data
         })
 
-    @action(detail=True, methods=['patch'], permission_classes=[IsManagerUser])
+    @action(detail=True, methods=['patch'])
     def update_profile(self, request, pk=None):
         """Update user profile (name, email, telegram, department)"""
         user = self.get_object()
@@ -479,13 +565,13 @@ class UserManagementViewSet(viewsets.ModelViewSet):
             })
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    @action(detail=True, methods=['delete'], permission_classes=[IsManagerUser])
+    @action(detail=True, methods=['delete'])
     def delete_user(self, request, pk=None):
         """Permanently delete a user (admin only)"""
         user = self.get_object()
         
         # Prevent deleting yourself
-        if user == request.user:
+        if user.pk == request.user.pk:
             return Response(
                 {'error': 'Cannot delete your own account'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -498,7 +584,7 @@ class UserManagementViewSet(viewsets.ModelViewSet):
             'message': f'User {username} deleted successfully'
         })
 
-    @action(detail=True, methods=['post'], permission_classes=[IsManagerUser])
+    @action(detail=True, methods=['post'])
     def unlock_account(self, request, pk=None):
         """Unlock a locked user account (admin/manager only)"""
         user = self.get_object()
@@ -513,7 +599,7 @@ class UserManagementViewSet(viewsets.ModelViewSet):
         user.locked_at = None
         user.failed_login_attempts = 0
         user.last_failed_login = None
-        user.save()
+        user.save(update_fields=['is_locked', 'locked_at', 'failed_login_attempts', 'last_failed_login'])
 
         return Response({
             'message': f'Account unlocked successfully for {user.username}',
@@ -630,7 +716,7 @@ class ResetPasswordView(APIView):
 # DEPARTMENT & PRODUCT VIEWS
 # =====================
 
-class PublicDepartmentListView(generics.ListAPIView):
+class PublicDepartmentListView(EagerLoadingViewMixin, generics.ListAPIView):
     """Public endpoint to list active departments (for registration)"""
     serializer_class = DepartmentSerializer
     permission_classes = [AllowAny]
@@ -640,7 +726,7 @@ class PublicDepartmentListView(generics.ListAPIView):
         return Department.objects.filter(is_active=True).order_by('name')
 
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Department CRUD operations
 
@@ -652,6 +738,7 @@ class DepartmentViewSet(viewsets.ModelViewSet):
     serializer_class = DepartmentSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = None  # Return all as list for dropdowns
+    eager_loading_actions = EagerLoadingViewMixin.eager_loading_actions + ('set_manager',)
 
     # Cache list for 1 hour (departments rarely change)
     @method_decorator(cache_page(3600))
@@ -704,7 +791,7 @@ class DepartmentViewSet(viewsets.ModelViewSet):
         return Response(DepartmentSerializer(department).data)
 
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Product CRUD operations
 
@@ -747,7 +834,7 @@ class ProductViewSet(viewsets.ModelViewSet):
 # TICKET VIEWS
 # =====================
 
-class TicketViewSet(viewsets.ModelViewSet):
+class TicketViewSet(EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Ticket CRUD operations
 
@@ -764,24 +851,12 @@ class TicketViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        # Optimize queries with select_related for foreign keys and annotate counts
-        queryset = Ticket.objects.select_related(
-            'requester', 'requester__user_department',
-            'assigned_to', 'assigned_to__user_department',
-            'approver', 'approver__user_department',
-            'pending_approver', 'pending_approver__user_department',
-            'dept_approver',
-            'target_department',
-            'ticket_product',
-            'deleted_by'
-        ).prefetch_related(
-            'product_items', 'product_items__product',  # For Ads/Telegram multi-product support
-            'collaborators', 'collaborators__user'  # For user count display
-        ).annotate(
-            # Annotate counts to avoid N+1 queries in serializers
-            comment_count_annotated=Count('comments', distinct=True),
-            attachment_count_annotated=Count('attachments', distinct=True)
-        )
+        # Joins/prefetches come from the serializer (EagerLoadingViewMixin)
+        queryset = Ticket.objects.all()
+
+        if self.action == 'approve':
+            # Approval routing checks the department approver
+            queryset = queryset.select_related('dept_approver')
 
         # Filter out deleted tickets by default (unless viewing trash)
         include_deleted = self.request.query_params.get('include_deleted', 'false').lower() == 'true'
@@ -806,6 +881,12 @@ class TicketViewSet(viewsets.ModelViewSet):
         if priority_filter:
             queryset = queryset.filter(priority=priority_filter)
 
+        # Comma-separated, e.g. ?request_type=socmed_posting,photoshoot; pair
+        # with ?fields= to leave out product_items/collaborators for such lists
+        request_type_filter = self.request.query_params.get('request_type')
+        if request_type_filter:
+            queryset = queryset.filter(request_type__in=request_type_filter.split(','))
+
         assigned_filter = self.request.query_params.get('assigned_to')
         if assigned_filter:
             queryset = queryset.filter(assigned_to_id=assigned_filter)
@@ -891,6 +972,8 @@ class TicketViewSet(viewsets.ModelViewSet):
                 raise PermissionDenied("You can only submit tickets to your own department.")
 
         ticket = serializer.save(requester=requester)
+        # Snapshots are taken as each step happens; the rows go out in one INSERT
+        activity_logs = []
 
         # Auto-set criteria based on request_type for scheduled tasks
         if ticket.request_type == 'videoshoot':
@@ -901,7 +984,7 @@ class TicketViewSet(viewsets.ModelViewSet):
             ticket.criteria = 'video'  # Live production is typically video
 
         # Get Creative department info (use filter().first() to handle multiple or none)
-        creative_dept = Department.objects.filter(is_creative=True).first()
+        creative_dept = Department.objects.select_related('manager').filter(is_creative=True).first()
         creative_manager = creative_dept.manager if creative_dept else None
 
         # Check requester's department relationship
@@ -915,7 +998,8 @@ class TicketViewSet(viewsets.ModelViewSet):
             ticket.approver = requester
             ticket.approved_at = timezone.now()
             ticket.pending_approver = None
-            log_activity(requester, ticket, ActivityLog.ActionType.APPROVED, 'Auto-approved (Creative Manager)')
+            activity_logs.append(build_activity_log(
+                requester, ticket, ActivityLog.ActionType.APPROVED, 'Auto-approved (Creative Manager)'))
 
         elif is_in_creative_dept:
             # Creative member (non-manager) creates ticket → Skip dept approval
@@ -983,8 +1067,9 @@ class TicketViewSet(viewsets.ModelViewSet):
                     notification_type=Notification.NotificationType.ASSIGNED
                 )
                 notify_user(assigned_user, 'assigned', ticket, actor=requester)
-                log_activity(requester, ticket, ActivityLog.ActionType.ASSIGNED,
-                            f'Pre-assigned to {assigned_user.username}. Deadline: {deadline_info}')
+                activity_logs.append(build_activity_log(
+                    requester, ticket, ActivityLog.ActionType.ASSIGNED,
+                    f'Pre-assigned to {assigned_user.username}. Deadline: {deadline_info}'))
 
         # Create analytics record
         TicketAnalytics.objects.create(
@@ -994,7 +1079,8 @@ class TicketViewSet(viewsets.ModelViewSet):
         )
 
         # Log creation
-        log_activity(requester, ticket, ActivityLog.ActionType.CREATED)
+        activity_logs.append(build_activity_log(requester, ticket, ActivityLog.ActionType.CREATED))
+        ActivityLog.objects.bulk_create(activity_logs)
 
     # =====================
     # TICKET ACTIONS
@@ -1017,7 +1103,7 @@ class TicketViewSet(viewsets.ModelViewSet):
         user = request.user
 
         # Get Creative department info (use filter().first() to handle multiple or none)
-        creative_dept = Department.objects.filter(is_creative=True).first()
+        creative_dept = Department.objects.select_related('manager').filter(is_creative=True).first()
         creative_manager = creative_dept.manager if creative_dept else None
 
         # Check if user is in Creative department
@@ -1089,7 +1175,7 @@ class TicketViewSet(viewsets.ModelViewSet):
         is_same_dept_manager = (
             user_dept and requester_dept and
             user_dept.id == requester_dept.id and
-            (requester_dept.manager == user or user.is_manager)
+            (requester_dept.manager_id == user.id or user.is_manager)
         )
 
         # Admin can also approve
@@ -1451,7 +1537,7 @@ class TicketViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
 
         # Only requester or collaborators can request revision
-        is_requester = ticket.requester == request.user
+        is_requester = ticket.requester_id == request.user.id
         is_collaborator = ticket.collaborators.filter(user=request.user).exists()
 
         if not is_requester and not is_collaborator and not request.user.is_manager:
@@ -1513,8 +1599,7 @@ class TicketViewSet(viewsets.ModelViewSet):
         ticket = self.get_object()
 
         if request.method == 'GET':
-            # Only return top-level comments (replies are nested)
-            comments = ticket.comments.filter(parent__isnull=True)
+            comments = comment_thread_queryset().filter(ticket=ticket)
             serializer = TicketCommentSerializer(comments, many=True)
             return Response(serializer.data)
 
@@ -1558,10 +1643,13 @@ class TicketViewSet(viewsets.ModelViewSet):
                 # Send Telegram notification
                 notify_user(user, 'comment', ticket, comment.comment[:100], actor=request.user)
 
-            return Response(
-                TicketCommentSerializer(comment).data,
-                status=status.HTTP_201_CREATED
-            )
+            # Replies have no replies field; a new top-level comment has none yet
+            if parent_comment:
+                data = ReplyCommentSerializer(comment).data
+            else:
+                comment.cached_replies = []
+                data = TicketCommentSerializer(comment).data
+            return Response(data, status=status.HTTP_201_CREATED)
 
     # =====================
     # ATTACHMENTS
@@ -1573,7 +1661,7 @@ class TicketViewSet(viewsets.ModelViewSet):
         ticket = self.get_object()
 
         if request.method == 'GET':
-            attachments = ticket.attachments.all()
+            attachments = TicketAttachmentSerializer.setup_eager_loading(ticket.attachments.all())
             serializer = TicketAttachmentSerializer(attachments, many=True)
             return Response(serializer.data)
 
@@ -1610,7 +1698,7 @@ class TicketViewSet(viewsets.ModelViewSet):
         ticket = self.get_object()
 
         if request.method == 'GET':
-            collaborators = ticket.collaborators.all()
+            collaborators = TicketCollaboratorSerializer.setup_eager_loading(ticket.collaborators.all())
             serializer = TicketCollaboratorSerializer(collaborators, many=True)
             return Response(serializer.data)
 
@@ -1683,7 +1771,9 @@ class TicketViewSet(viewsets.ModelViewSet):
     def history(self, request, pk=None):
         """Get ticket activity history with snapshots for rollback"""
         ticket = self.get_object()
-        activities = ActivityLog.objects.filter(ticket=ticket).order_by('-created_at')
+        activities = ActivityLogSerializer.setup_eager_loading(
+            ActivityLog.objects.filter(ticket=ticket)
+        ).order_by('-created_at')
         return Response(ActivityLogSerializer(activities, many=True).data)
 
     @action(detail=True, methods=['post'], permission_classes=[IsManagerUser])
@@ -1849,8 +1939,8 @@ class TicketViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[IsManagerUser])
     def trash(self, request):
         """List all deleted tickets (trash bin)"""
-        queryset = Ticket.objects.filter(is_deleted=True).select_related(
-            'requester', 'assigned_to', 'deleted_by'
+        queryset = TicketListSerializer.setup_eager_loading(
+            Ticket.objects.filter(is_deleted=True)
         ).order_by('-deleted_at')
         
         serializer = TicketListSerializer(queryset, many=True)
@@ -1899,7 +1989,7 @@ class AttachmentDeleteView(generics.DestroyAPIView):
 # NOTIFICATION VIEWS
 # =====================
 
-class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
+class NotificationViewSet(EagerLoadingViewMixin, viewsets.ReadOnlyModelViewSet):
     """
     Notification endpoints
 
@@ -1909,6 +1999,7 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = None  # Return all as list for dropdowns
+    eager_loading_actions = EagerLoadingViewMixin.eager_loading_actions + ('read',)
 
     def get_queryset(self):
         return Notification.objects.filter(user=self.request.user)
@@ -1943,67 +2034,35 @@ class DashboardView(APIView):
     Dashboard statistics and overview.
 
     Caching Strategy (Netflix-style):
-    - Stats cached for 5 minutes per user role (manager vs member)
-    - Cache key includes role to show different data
-    - Invalidated when tickets are created/updated/deleted
+    - Stats cached for 5 minutes per user (members only count their own
+      tickets, and my_assigned is personal for everyone)
+    - Cache key includes a version that any ticket save/delete bumps
+      (api.signals), so all dashboards refresh together
     """
     permission_classes = [IsAuthenticated]
     pagination_class = None  # Return all as list for dropdowns
 
     def get(self, request):
-        from .cache_utils import get_cache_key, CACHE_TTL_DASHBOARD
+        from .cache_utils import get_dashboard_cache_key, CACHE_TTL_DASHBOARD
 
         user = request.user
-        role = 'manager' if user.is_manager else 'member'
-        cache_key = get_cache_key('dashboard', 'stats', f'role:{role}')
+        cache_key = get_dashboard_cache_key(user)
 
         # Try to get from cache first
         cached_stats = cache.get(cache_key)
         if cached_stats is not None:
-            logger.debug(f'Dashboard cache HIT for role:{role}')
+            logger.debug(f'Dashboard cache HIT for user:{user.id}')
             return Response(cached_stats)
 
-        logger.debug(f'Dashboard cache MISS for role:{role}')
+        logger.debug(f'Dashboard cache MISS for user:{user.id}')
 
         # Base queryset - exclude deleted tickets
-        if user.is_manager:
-            tickets = Ticket.objects.filter(is_deleted=False)
-        else:
-            tickets = Ticket.objects.filter(
-                Q(requester=user) | Q(assigned_to=user),
-                is_deleted=False
-            )
+        tickets = DashboardStatsSerializer.base_queryset(user)
 
         now = timezone.now()
 
-        # OPTIMIZED: Single aggregate query for all counts (instead of 15+ queries)
-        counts = tickets.aggregate(
-            total=Count('id'),
-            pending_approval=Count(Case(When(status=Ticket.Status.REQUESTED, then=1))),
-            pending_creative=Count(Case(When(status=Ticket.Status.PENDING_CREATIVE, then=1))),
-            in_progress=Count(Case(When(status=Ticket.Status.IN_PROGRESS, then=1))),
-            completed=Count(Case(When(status=Ticket.Status.COMPLETED, then=1))),
-            approved=Count(Case(When(status=Ticket.Status.APPROVED, then=1))),
-            rejected=Count(Case(When(status=Ticket.Status.REJECTED, then=1))),
-            overdue=Count(Case(When(
-                deadline__lt=now,
-                status__in=[Ticket.Status.REQUESTED, Ticket.Status.PENDING_CREATIVE, 
-                           Ticket.Status.APPROVED, Ticket.Status.IN_PROGRESS],
-                then=1
-            ))),
-            # Priority counts
-            urgent=Count(Case(When(priority='urgent', then=1))),
-            high=Count(Case(When(priority='high', then=1))),
-            medium=Count(Case(When(priority='medium', then=1))),
-            low=Count(Case(When(priority='low', then=1))),
-        )
-
-        # My assigned count (separate query since it uses different base)
-        my_assigned = Ticket.objects.filter(
-            assigned_to=user, is_deleted=False
-        ).exclude(
-            status__in=[Ticket.Status.COMPLETED, Ticket.Status.REJECTED]
-        ).count()
+        # OPTIMIZED: Single aggregate query for all counts, including my_assigned
+        counts = DashboardStatsSerializer.compute(user, now)
 
         # Basic stats
         stats = {
@@ -2015,7 +2074,7 @@ class DashboardView(APIView):
             'approved': counts['approved'],
             'rejected': counts['rejected'],
             'overdue': counts['overdue'],
-            'my_assigned': my_assigned
+            'my_assigned': counts['my_assigned']
         }
 
         # Status breakdown for pie chart
@@ -2036,21 +2095,25 @@ class DashboardView(APIView):
             {'name': 'Low', 'count': counts['low'], 'color': '#22C55E'},
         ]
 
-        # OPTIMIZED: Weekly trends using single annotated query (instead of 14 queries)
+        # OPTIMIZED: Weekly trends grouped by day in SQL, so only the per-day
+        # counts come back (days are UTC dates, like now.date())
         seven_days_ago = now - timedelta(days=7)
-        weekly_tickets = tickets.filter(
-            Q(created_at__gte=seven_days_ago) | 
-            Q(status=Ticket.Status.COMPLETED, updated_at__gte=seven_days_ago)
-        ).values('created_at', 'updated_at', 'status')
+        created_by_day = dict(
+            tickets.filter(created_at__gte=seven_days_ago)
+            .annotate(day=TruncDate('created_at', tzinfo=dt_timezone.utc))
+            .values('day').annotate(n=Count('id')).values_list('day', 'n')
+        )
+        completed_by_day = dict(
+            tickets.filter(status=Ticket.Status.COMPLETED, updated_at__gte=seven_days_ago)
+            .annotate(day=TruncDate('updated_at', tzinfo=dt_timezone.utc))
+            .values('day').annotate(n=Count('id')).values_list('day', 'n')
+        )
 
-        # Build weekly data from prefetched results
         weekly_data = []
         for i in range(6, -1, -1):
             day = now.date() - timedelta(days=i)
-            created = sum(1 for t in weekly_tickets if t['created_at'].date() == day)
-            completed = sum(1 for t in weekly_tickets 
-                         if t['status'] == Ticket.Status.COMPLETED 
-                         and t['updated_at'].date() == day)
+            created = created_by_day.get(day, 0)
+            completed = completed_by_day.get(day, 0)
             weekly_data.append({
                 'day': day.strftime('%a'),
                 'date': day.strftime('%m/%d'),
@@ -2064,12 +2127,12 @@ class DashboardView(APIView):
 
         # Cache the stats before returning
         cache.set(cache_key, stats, CACHE_TTL_DASHBOARD)
-        logger.debug(f'Dashboard stats cached for role:{role}')
+        logger.debug(f'Dashboard stats cached for user:{user.id}')
 
         return Response(stats)
 
 
-class MyTasksView(generics.ListAPIView):
+class MyTasksView(EagerLoadingViewMixin, generics.ListAPIView):
     """Get tickets assigned to current user AND tickets needing approval for managers"""
     serializer_class = TicketListSerializer
     permission_classes = [IsAuthenticated]
@@ -2095,21 +2158,13 @@ class MyTasksView(generics.ListAPIView):
                 status__in=[Ticket.Status.REQUESTED, Ticket.Status.PENDING_CREATIVE]
             )
             # Combine both querysets
-            return (assigned_tickets | approval_tickets).distinct().select_related(
-                'requester', 'assigned_to', 'target_department', 'ticket_product'
-            ).prefetch_related(
-                'collaborators__user'
-            ).order_by('-created_at')
-
-        return assigned_tickets.select_related(
-            'requester', 'assigned_to', 'target_department', 'ticket_product'
-        ).prefetch_related(
-            'collaborators__user'
-        ).order_by('-created_at')
+            return (assigned_tickets | approval_tickets).distinct().order_by('-created_at')
+
+        return assigned_tickets.order_by('-created_at')
 
     def list(self, request, *args, **kwargs):
         """Override list to add task_type field to each ticket"""
-        queryset = self.get_queryset()
+        queryset = self.filter_queryset(self.get_queryset())
         serializer = self.get_serializer(queryset, many=True)
         data = serializer.data
 
@@ -2143,7 +2198,7 @@ class TeamOverviewView(generics.ListAPIView):
         return Response(list(users))
 
 
-class OverdueTicketsView(generics.ListAPIView):
+class OverdueTicketsView(EagerLoadingViewMixin, generics.ListAPIView):
     """Get overdue tickets"""
     serializer_class = TicketListSerializer
     permission_classes = [IsAuthenticated]
@@ -2155,7 +2210,7 @@ class OverdueTicketsView(generics.ListAPIView):
             deadline__lt=timezone.now()
         ).exclude(
             status__in=[Ticket.Status.COMPLETED, Ticket.Status.REJECTED]
-        ).select_related('requester', 'assigned_to')
+        )
 
         if not user.is_manager:
             queryset = queryset.filter(
@@ -2209,7 +2264,7 @@ class PendingApprovalsByDeptView(APIView):
 # ACTIVITY LOG VIEWS
 # =====================
 
-class ActivityLogListView(generics.ListAPIView):
+class ActivityLogListView(EagerLoadingViewMixin, generics.ListAPIView):
     """Get activity logs for tickets"""
     serializer_class = ActivityLogSerializer
     permission_classes = [IsAuthenticated]
@@ -2217,11 +2272,7 @@ class ActivityLogListView(generics.ListAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        # Optimize with ticket-related fields to avoid N+1
-        queryset = ActivityLog.objects.select_related(
-            'user', 'user__user_department',
-            'ticket', 'ticket__requester', 'ticket__assigned_to'
-        )
+        queryset = ActivityLog.objects.all()
 
         # Managers see all activity, others see only their tickets
         if not user.is_manager:
@@ -2236,6 +2287,21 @@ class ActivityLogListView(generics.ListAPIView):
 
         return queryset[:100]  # Limit to last 100 activities
 
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get('fast') != '1':
+            return super().list(request, *args, **kwargs)
+
+        # ?fast=1: flat rows straight from values() for feeds that only need
+        # who/what/when - no model instances, nested user or snapshot payload
+        rows = list(self.get_queryset().values(
+            'id', 'ticket', 'action', 'details', 'created_at',
+            username=F('user__username'), ticket_title=F('ticket__title'),
+        ))
+        created_at = ActivityLogSerializer().fields['created_at']
+        for row in rows:
+            row['created_at'] = created_at.to_representation(row['created_at'])
+        return Response(rows)
+
 
 # =====================
 # ANALYTICS VIEWS
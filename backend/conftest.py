@@ -3,37 +3,107 @@ Pytest configuration and fixtures for Juan365 Ticketing System tests
 """
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save
 from rest_framework.test import APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
 from api.models import Ticket, TicketComment, TicketAttachment, TicketCollaborator, Notification, ActivityLog, Department
 
 User = get_user_model()
 
 
+# ============================================================
+# SESSION DATA
+# ============================================================
+
+@pytest.fixture(scope='session')
+def base_data(django_db_setup, django_db_blocker):
+    """
+    Create the departments and admin/manager/member users once per session.
+
+    Rows are committed outside the per-test transaction, so every test sees
+    them and any changes a test makes are rolled back afterwards. Returns
+    primary keys only; the function-scoped fixtures below fetch fresh
+    instances so in-memory edits never leak between tests.
+    """
+    with django_db_blocker.unblock():
+        department = Department.objects.create(
+            name='Engineering',
+            description='Engineering department',
+            is_creative=False,
+            is_active=True
+        )
+        creative_department = Department.objects.create(
+            name='Creative',
+            description='Creative department',
+            is_creative=True,
+            is_active=True
+        )
+        admin_user = User.objects.create_user(
+            username='admin_test',
+            email='admin@test.com',
+            password='adminpass123',
+            first_name='Admin',
+            last_name='User',
+            role='admin',
+            is_approved=True,
+            is_staff=True,
+            is_superuser=True,
+            user_department=creative_department
+        )
+        manager_user = User.objects.create_user(
+            username='manager_test',
+            email='manager@test.com',
+            password='managerpass123',
+            first_name='Manager',
+            last_name='User',
+            role='manager',
+            is_approved=True,
+            user_department=department
+        )
+        # Set this user as the department manager
+        department.manager = manager_user
+        department.save()
+        member_user = User.objects.create_user(
+            username='member_test',
+            email='member@test.com',
+            password='memberpass123',
+            first_name='Member',
+            last_name='User',
+            role='member',
+            is_approved=True,
+            user_department=department
+        )
+    return {
+        'department': department.pk,
+        'creative_department': creative_department.pk,
+        'admin_user': admin_user.pk,
+        'manager_user': manager_user.pk,
+        'member_user': member_user.pk,
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """The database rolls back after each test; the cache has to be emptied by hand"""
+    yield
+    cache.clear()
+
+
 # ============================================================
 # DEPARTMENT FIXTURES
 # ============================================================
 
 @pytest.fixture
-def department(db):
-    """Create a regular (non-creative) department"""
-    return Department.objects.create(
-        name='Engineering',
-        description='Engineering department',
-        is_creative=False,
-        is_active=True
-    )
+def department(db, base_data):
+    """Return the regular (non-creative) department"""
+    return Department.objects.get(pk=base_data['department'])
 
 
 @pytest.fixture
-def creative_department(db):
-    """Create the Creative department"""
-    return Department.objects.create(
-        name='Creative',
-        description='Creative department',
-        is_creative=True,
-        is_active=True
-    )
+def creative_department(db, base_data):
+    """Return the Creative department"""
+    return Department.objects.get(pk=base_data['creative_department'])
 
 
 # ============================================================
@@ -47,56 +117,21 @@ def api_client():
 
 
 @pytest.fixture
-def admin_user(db, creative_department):
-    """Create and return an admin user in Creative department"""
-    user = User.objects.create_user(
-        username='admin_test',
-        email='admin@test.com',
-        password='adminpass123',
-        first_name='Admin',
-        last_name='User',
-        role='admin',
-        is_approved=True,
-        is_staff=True,
-        is_superuser=True,
-        user_department=creative_department
-    )
-    return user
+def admin_user(db, base_data):
+    """Return the admin user in Creative department"""
+    return User.objects.get(pk=base_data['admin_user'])
 
 
 @pytest.fixture
-def manager_user(db, department):
-    """Create and return a manager user in regular department"""
-    user = User.objects.create_user(
-        username='manager_test',
-        email='manager@test.com',
-        password='managerpass123',
-        first_name='Manager',
-        last_name='User',
-        role='manager',
-        is_approved=True,
-        user_department=department
-    )
-    # Set this user as the department manager
-    department.manager = user
-    department.save()
-    return user
+def manager_user(db, base_data):
+    """Return the manager user (and department manager) in regular department"""
+    return User.objects.get(pk=base_data['manager_user'])
 
 
 @pytest.fixture
-def member_user(db, department):
-    """Create and return a regular member user in regular department"""
-    user = User.objects.create_user(
-        username='member_test',
-        email='member@test.com',
-        password='memberpass123',
-        first_name='Member',
-        last_name='User',
-        role='member',
-        is_approved=True,
-        user_department=department
-    )
-    return user
+def member_user(db, base_data):
+    """Return the regular member user in regular department"""
+    return User.objects.get(pk=base_data['member_user'])
 
 
 @pytest.fixture
@@ -171,20 +206,10 @@ def inactive_user(db, department):
 # AUTHENTICATED CLIENT FIXTURES
 # ============================================================
 
-def get_tokens_for_user(user):
-    """Generate JWT tokens for a user"""
-    refresh = RefreshToken.for_user(user)
-    return {
-        'refresh': str(refresh),
-        'access': str(refresh.access_token),
-    }
-
-
 @pytest.fixture
 def admin_client(api_client, admin_user):
     """Return an API client authenticated as admin"""
-    tokens = get_tokens_for_user(admin_user)
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens["access"]}')
+    api_client.force_authenticate(user=admin_user)
     api_client.user = admin_user
     return api_client
 
@@ -192,8 +217,7 @@ def admin_client(api_client, admin_user):
 @pytest.fixture
 def manager_client(api_client, manager_user):
     """Return an API client authenticated as manager"""
-    tokens = get_tokens_for_user(manager_user)
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens["access"]}')
+    api_client.force_authenticate(user=manager_user)
     api_client.user = manager_user
     return api_client
 
@@ -201,8 +225,7 @@ def manager_client(api_client, manager_user):
 @pytest.fixture
 def member_client(api_client, member_user):
     """Return an API client authenticated as member"""
-    tokens = get_tokens_for_user(member_user)
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens["access"]}')
+    api_client.force_authenticate(user=member_user)
     api_client.user = member_user
     return api_client
 
@@ -210,8 +233,7 @@ def member_client(api_client, member_user):
 @pytest.fixture
 def creative_client(api_client, creative_user):
     """Return an API client authenticated as creative user"""
-    tokens = get_tokens_for_user(creative_user)
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens["access"]}')
+    api_client.force_authenticate(user=creative_user)
     api_client.user = creative_user
     return api_client
 
@@ -219,8 +241,7 @@ def creative_client(api_client, creative_user):
 @pytest.fixture
 def creative_manager_client(api_client, creative_manager):
     """Return an API client authenticated as creative manager"""
-    tokens = get_tokens_for_user(creative_manager)
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens["access"]}')
+    api_client.force_authenticate(user=creative_manager)
     api_client.user = creative_manager
     return api_client
 
@@ -296,6 +317,17 @@ def ticket_completed(db, member_user, manager_user, admin_user):
     )
 
 
+@pytest.fixture
+def other_user_ticket(db, admin_user):
+    """Create a ticket requested by the admin, not visible to regular members"""
+    return Ticket.objects.create(
+        title='Other User Ticket',
+        description='Not visible to member',
+        requester=admin_user,
+        status='requested'
+    )
+
+
 @pytest.fixture
 def ticket_with_deadline(db, member_user):
     """Create a ticket with a deadline"""
@@ -311,23 +343,32 @@ def ticket_with_deadline(db, member_user):
     )
 
 
-@pytest.fixture
-def multiple_tickets(db, member_user, manager_user, admin_user):
-    """Create multiple tickets for list testing"""
-    tickets = []
+@pytest.fixture(scope='class')
+def multiple_tickets(django_db_setup, django_db_blocker, base_data):
+    """
+    Create multiple tickets for list testing, once per test class.
+
+    The rows live in an outer transaction that is rolled back after the
+    class; each test's own transaction nests inside it as a savepoint.
+    Only use this from tests that don't modify the tickets.
+    """
     statuses = ['requested', 'approved', 'in_progress', 'completed', 'rejected']
     priorities = ['low', 'medium', 'high', 'urgent']
 
-    for i in range(10):
-        ticket = Ticket.objects.create(
-            title=f'Test Ticket {i+1}',
-            description=f'Description for ticket {i+1}',
-            requester=member_user if i % 2 == 0 else admin_user,
-            status=statuses[i % len(statuses)],
-            priority=priorities[i % len(priorities)]
-        )
-        tickets.append(ticket)
-    return tickets
+    with django_db_blocker.unblock(), transaction.atomic():
+        member_user = User.objects.get(pk=base_data['member_user'])
+        admin_user = User.objects.get(pk=base_data['admin_user'])
+        yield Ticket.objects.bulk_create([
+            Ticket(
+                title=f'Test Ticket {i+1}',
+                description=f'Description for ticket {i+1}',
+                requester=member_user if i % 2 == 0 else admin_user,
+                status=statuses[i % len(statuses)],
+                priority=priorities[i % len(priorities)]
+            )
+            for i in range(10)
+        ])
+        transaction.set_rollback(True)
 
 
 # ============================================================
@@ -392,21 +433,58 @@ def user_notification(db, member_user, ticket_requested):
     )
 
 
+class NotificationFactory:
+    """Build unsaved notifications on a ticket and insert them in one query"""
+
+    def __init__(self, ticket):
+        self.ticket = ticket
+        self.pending = []
+
+    def __call__(self, user, **kwargs):
+        kwargs.setdefault('message', 'Test notification message')
+        kwargs.setdefault('notification_type', 'new_request')
+        notification = Notification(user=user, ticket=self.ticket, **kwargs)
+        self.pending.append(notification)
+        return notification
+
+    def flush(self):
+        """bulk_create everything built since the last flush"""
+        created = Notification.objects.bulk_create(self.pending)
+        self.pending = []
+        return created
+
+
+@pytest.fixture
+def notification_factory(db, ticket_requested):
+    """Return a NotificationFactory for ticket_requested; call .flush() to save"""
+    return NotificationFactory(ticket_requested)
+
+
+@pytest.fixture
+def admin_notification(db, admin_user, ticket_requested):
+    """Create a notification belonging to another user (admin)"""
+    return Notification.objects.create(
+        user=admin_user,
+        ticket=ticket_requested,
+        message='Admin notification',
+        notification_type='assigned'
+    )
+
+
 @pytest.fixture
 def multiple_notifications(db, member_user, ticket_requested):
     """Create multiple notifications"""
-    notifications = []
     types = ['new_request', 'approved', 'assigned', 'comment']
-    for i, ntype in enumerate(types):
-        notif = Notification.objects.create(
+    return Notification.objects.bulk_create([
+        Notification(
             user=member_user,
             ticket=ticket_requested,
             message=f'Notification {i+1}',
             notification_type=ntype,
             is_read=i % 2 == 0  # Alternate read/unread
         )
-        notifications.append(notif)
-    return notifications
+        for i, ntype in enumerate(types)
+    ])
 
 
 # ============================================================
@@ -424,6 +502,20 @@ def activity_log(db, member_user, ticket_requested):
     )
 
 
+@pytest.fixture
+def activity_log_capture():
+    """Collect ActivityLog rows created during the test, via post_save"""
+    logs = []
+
+    def capture(sender, instance, created, **kwargs):
+        if created:
+            logs.append(instance)
+
+    post_save.connect(capture, sender=ActivityLog)
+    yield logs
+    post_save.disconnect(capture, sender=ActivityLog)
+
+
 # ============================================================
 # UTILITY FIXTURES
 # ============================================================
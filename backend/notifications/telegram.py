@@ -5,10 +5,16 @@ Sends notifications to both group chat and individual users
 import requests
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
+from django.db import transaction
 
 logger = logging.getLogger(__name__)
 
+# Background senders for messages queued from request handlers, so the
+# Telegram round trip doesn't hold up the HTTP response
+_send_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='telegram')
+
 
 def format_duration(seconds):
     """Format duration in seconds to human-readable string"""
@@ -120,6 +126,26 @@ def send_telegram_message(chat_id: str, message: str, parse_mode: str = 'HTML',
         return False
 
 
+def _send_in_background(*args):
+    """Executor target: a failed send must not vanish with the future"""
+    try:
+        send_telegram_message(*args)
+    except Exception:
+        logger.exception('Background Telegram send failed')
+
+
+def send_telegram_message_on_commit(chat_id: str, message: str, parse_mode: str = 'HTML',
+                                    reply_markup: dict = None):
+    """
+    Queue send_telegram_message() on a background thread once the current
+    transaction commits (right away outside a transaction). Nothing is sent
+    if the transaction rolls back.
+    """
+    transaction.on_commit(
+        lambda: _send_executor.submit(_send_in_background, chat_id, message, parse_mode, reply_markup)
+    )
+
+
 def create_ticket_keyboard(ticket_id: int, show_actions: bool = False) -> dict:
     """
     Create inline keyboard for ticket notifications
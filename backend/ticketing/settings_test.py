@@ -0,0 +1,40 @@
+"""
+Django settings for running the test suite.
+
+Extends the regular settings; only what the tests need to differ lives here.
+"""
+
+import atexit
+import shutil
+import tempfile
+
+from .settings import *  # noqa: F401,F403
+
+# In-memory SQLite: no disk I/O, and each xdist worker gets its own database.
+# Migrations are still checked against Postgres in CI (manage.py migrate).
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Tests don't need a slow hash; PBKDF2 dominated user creation and logins.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# APIClient requests encode their data as JSON unless told otherwise.
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'TEST_REQUEST_DEFAULT_FORMAT': 'json',
+}
+
+# Uploads go to a throwaway directory per test process (each xdist worker
+# gets its own), on local storage even when CLOUDINARY_URL is set.
+MEDIA_ROOT = tempfile.mkdtemp(prefix='ticketing-test-media-')
+atexit.register(shutil.rmtree, MEDIA_ROOT, ignore_errors=True)
+STORAGES = {
+    **STORAGES,
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+}
@@ -21,7 +21,7 @@ const TicketPreviewModal = ({ ticketId, onClose, currentUser, isManager, users,
   const fetchTicket = async () => {
     setLoading(true);
     try {
-      const response = await ticketsAPI.get(ticketId);
+      const response = await ticketsAPI.get(ticketId, { include: 'attachments,collaborators' });
       setTicket(response.data);
     } catch (error) {
       console.error('Failed to fetch ticket:', error);
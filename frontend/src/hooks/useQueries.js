@@ -130,7 +130,7 @@ export const useTicket = (id) => {
   return useQuery({
     queryKey: queryKeys.ticketDetail(id),
     queryFn: async () => {
-      const response = await ticketsAPI.get(id);
+      const response = await ticketsAPI.get(id, { include: 'attachments,collaborators' });
       return response.data;
     },
     enabled: !!id, // Only run if ID is provided
@@ -113,7 +113,8 @@ const TicketDetail = () => {
         default:
           return;
       }
-      setTicket(response.data);
+      // Action responses omit attachments/collaborators; keep the ones already loaded
+      setTicket(prev => ({ ...prev, ...response.data }));
       toast.success(`Action "${action}" completed successfully!`);
     } catch (error) {
       toast.error(error.response?.data?.error || 'Action failed');
@@ -224,7 +225,7 @@ const TicketDetail = () => {
     setActionLoading(true);
     try {
       const response = await ticketsAPI.confirmComplete(id);
-      setTicket(response.data);
+      setTicket(prev => ({ ...prev, ...response.data }));
       setShowConfirmModal(false);
       toast.success('Completion confirmed!');
     } catch (error) {
@@ -287,7 +288,7 @@ const TicketDetail = () => {
     setRollbackLoading(true);
     try {
       const response = await ticketsAPI.rollback(id, activityId);
-      setTicket(response.data);
+      setTicket(prev => ({ ...prev, ...response.data }));
       setShowHistoryModal(false);
       toast.success('Ticket restored to previous state');
       // No fetchData() needed - response already has updated ticket
@@ -306,7 +307,7 @@ const TicketDetail = () => {
     setActionLoading(true);
     try {
       const response = await ticketsAPI.requestRevision(id, revisionComments);
-      setTicket(response.data);
+      setTicket(prev => ({ ...prev, ...response.data }));
       setShowRevisionModal(false);
       setRevisionComments('');
       toast.success('Revision requested successfully');
@@ -77,8 +77,10 @@ export const ticketsAPI = {
   list: (params = {}) =>
     api.get('/tickets/', { params }),
 
-  get: (id) =>
-    api.get(`/tickets/${id}/`),
+  // Ticket detail omits attachments/collaborators unless asked for,
+  // e.g. get(id, { include: 'attachments,collaborators' })
+  get: (id, params = {}) =>
+    api.get(`/tickets/${id}/`, { params }),
 
   create: (data) =>
     api.post('/tickets/', data),